@@ -15,6 +15,11 @@ from backend.app.analyzers.knowledge_base import KnowledgeBase
 
 logger = logging.getLogger(__name__)
 
+# Category path segments that say nothing about a setting's functional area
+_GENERIC_CATEGORY_ROOTS = frozenset({
+    "Computer Configuration", "User Configuration", "Policies", "Administrative Templates"
+})
+
 
 class ImprovementEngine:
     """
@@ -237,7 +242,7 @@ class ImprovementEngine:
                 parts = s.category.split('\\')
                 # Try to find meaningful part (skip generic roots)
                 for part in parts:
-                    if part not in ["Computer Configuration", "User Configuration", "Policies", "Administrative Templates"]:
+                    if part not in _GENERIC_CATEGORY_ROOTS:
                         categories.append(part)
                         break
             
@@ -4,18 +4,20 @@
 
 import uuid
 import logging
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends, Request
+from fastapi.responses import Response, StreamingResponse
 import io
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
 
 from backend.app.models.gpo import (
     AnalysisResult, UploadResponse, GPOInfo, PolicySetting,
-    ConflictReport, DuplicateReport, ImprovementSuggestion,
+    ConflictReport, DuplicateReport, ImprovementSuggestion, ImprovementCategory,
     SeverityLevel, ExportFormat, PolicyState
 )
 from backend.app.models.sql import StoredGPO, StoredSetting
@@ -24,7 +26,7 @@ from backend.app.parsers.gpo_parser import GPOParser
 from backend.app.analyzers.conflict_detector import detect_conflicts
 from backend.app.analyzers.duplicate_detector import detect_duplicates
 from backend.app.analyzers.improvement_engine import generate_improvements
-from backend.app.exporters.csv_exporter import export_to_csv
+from backend.app.exporters.csv_exporter import export_to_csv, export_to_csv_gzip, export_to_zip_stream
 from backend.app.exporters.pdf_exporter import export_to_pdf
 from backend.app.exporters.action_generator import ActionGenerator
 from backend.app.storage import (
@@ -41,6 +43,18 @@ _current_analysis: Optional[AnalysisResult] = None
 _uploaded_files: list[dict] = []
 _current_session_gpo_ids: list[str] = [] # IDs of GPOs in current "session"
 
+# Enum members keyed by their stored/query string, for lookups in hot loops
+_POLICY_STATES = {state.value: state for state in PolicyState}
+_IMPROVEMENT_CATEGORIES = {cat.value: cat for cat in ImprovementCategory}
+
+# Serializes whole analyses in pydantic-core, bypassing jsonable_encoder
+_RESULT_ADAPTER = TypeAdapter(AnalysisResult)
+
+
+def _analysis_response(result: AnalysisResult) -> Response:
+    """Serialize an analysis result straight to a JSON response."""
+    return Response(content=_RESULT_ADAPTER.dump_json(result), media_type="application/json")
+
 
 # =============================================================================
 # File Upload Endpoints
@@ -80,35 +94,9 @@ async def upload_gpo_files(
             try:
                 content = await file.read()
                 
-                # Detect encoding from BOM or heuristics (same logic as parse_file)
-                encoding = 'utf-8'
-                
-                # Check for BOM markers
-                if content[:2] == b'\xff\xfe':
-                    encoding = 'utf-16-le'
-                    logger.debug(f"Detected UTF-16LE encoding (BOM) for {file.filename}")
-                elif content[:2] == b'\xfe\xff':
-                    encoding = 'utf-16-be'
-                    logger.debug(f"Detected UTF-16BE encoding (BOM) for {file.filename}")
-                elif content[:3] == b'\xef\xbb\xbf':
-                    encoding = 'utf-8'
-                    logger.debug(f"Detected UTF-8 encoding (BOM) for {file.filename}")
-                else:
-                    # No BOM, try to detect from content (check for UTF-16 pattern)
-                    if len(content) > 100:
-                        null_count = content[:100].count(b'\x00')
-                        if null_count > 20:  # Likely UTF-16
-                            encoding = 'utf-16-le'
-                            logger.debug(f"Detected UTF-16LE encoding (heuristic) for {file.filename}")
-                
-                try:
-                    content_str = content.decode(encoding)
-                except Exception as e:
-                    logger.warning(f"Failed to decode {file.filename} with {encoding}, falling back to UTF-8: {e}")
-                    content_str = content.decode('utf-8', errors='replace')
-                
+                # Raw bytes: the parser detects the encoding and lxml decodes
                 gpos, settings = parser.parse_content(
-                    content_str, 
+                    content, 
                     file.filename or "unknown",
                     file.content_type or ""
                 )
@@ -143,20 +131,20 @@ async def upload_gpo_files(
                     
                     # Store Settings
                     # Filter settings for this GPO (parser returns flat list for file, but they have gpo_id)
-                    gpo_settings = [s for s in settings if s.gpo_id == gpo.id]
-                    for s in gpo_settings:
-                        stored_setting = StoredSetting(
-                            gpo_id=gpo.id,
-                            gpo_name=gpo.name,
-                            category=s.category,
-                            name=s.name,
-                            state=s.state.value,
-                            value=s.value,
-                            registry_path=s.registry_path,
-                            registry_value=s.registry_value,
-                            scope=s.scope
-                        )
-                        session.add(stored_setting)
+                    StoredSetting.bulk_insert(session, [
+                        {
+                            "gpo_id": gpo.id,
+                            "gpo_name": gpo.name,
+                            "category": s.category,
+                            "name": s.name,
+                            "state": s.state.value,
+                            "value": s.value,
+                            "registry_path": s.registry_path,
+                            "registry_value": s.registry_value,
+                            "scope": s.scope,
+                        }
+                        for s in settings if s.gpo_id == gpo.id
+                    ])
                     
                     _current_session_gpo_ids.append(gpo.id)
 
@@ -196,18 +184,9 @@ async def upload_gpo_files(
     duplicates = detect_duplicates(all_gpos, all_settings)
     improvements = generate_improvements(all_gpos, all_settings)
     
-    # Calculate severity counts
-    all_issues = conflicts + duplicates + [
-        type('obj', (object,), {'severity': s.severity})() for s in improvements
-    ]
-    
-    critical_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.CRITICAL)
-    high_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.HIGH)
-    medium_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.MEDIUM)
-    low_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.LOW)
-    
-    # Store analysis result
-    _current_analysis = AnalysisResult(
+    # Store analysis result. Every part was built by the parser and analyzers
+    # above, so skip re-validating the nested lists.
+    _current_analysis = AnalysisResult.model_construct(
         analyzed_at=datetime.now(),
         gpo_count=len(all_gpos),
         setting_count=len(all_settings),
@@ -215,14 +194,7 @@ async def upload_gpo_files(
         settings=all_settings,
         conflicts=conflicts,
         duplicates=duplicates,
-        improvements=improvements,
-        conflict_count=len(conflicts),
-        duplicate_count=len(duplicates),
-        improvement_count=len(improvements),
-        critical_issues=critical_count,
-        high_issues=high_count,
-        medium_issues=medium_count,
-        low_issues=low_count
+        improvements=improvements
     )
     
     return UploadResponse(
@@ -253,7 +225,7 @@ async def get_analysis():
     """Get the current analysis result."""
     if not _current_analysis:
         raise HTTPException(status_code=404, detail="No analysis available. Upload GPO files first.")
-    return _current_analysis
+    return _analysis_response(_current_analysis)
 
 
 @router.get("/gpos", response_model=list[GPOInfo])
@@ -329,7 +301,8 @@ async def get_improvements(
     improvements = _current_analysis.improvements
     
     if category:
-        improvements = [i for i in improvements if i.category.value == category]
+        wanted = _IMPROVEMENT_CATEGORIES.get(category)
+        improvements = [i for i in improvements if i.category is wanted]
     
     return improvements
 
@@ -398,44 +371,94 @@ async def generate_consolidation(suggestion_id: str):
 # Export Endpoints
 # =============================================================================
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already covers this export."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 @router.get("/export/csv")
-async def export_csv():
-    """Export analysis results to CSV."""
+async def export_csv(request: Request):
+    """Export analysis results to CSV (gzip-encoded when the client accepts it)."""
     if not _current_analysis:
         raise HTTPException(status_code=404, detail="No analysis available.")
     
-    # Use a copy to prevent state corruption
-    from copy import deepcopy
-    analysis_copy = deepcopy(_current_analysis)
-    csv_content = export_to_csv(analysis_copy, combined=True)
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    etag = f'"{_current_analysis.fingerprint()}{"-gzip" if use_gzip else ""}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
+    # Exported without a copy: the result models are frozen and the
+    # exporters only read them, so a cached export costs no O(N) work
     filename = f"gpo_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
+    if use_gzip:
+        return StreamingResponse(
+            export_to_csv_gzip(_current_analysis),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+                "ETag": etag
+            }
+        )
+    
+    csv_content = export_to_csv(_current_analysis, combined=True)
+    
     return StreamingResponse(
         io.StringIO(csv_content),
         media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Vary": "Accept-Encoding",
+            "ETag": etag
+        }
+    )
+
+
+@router.get("/export/zip")
+async def export_zip():
+    """Export analysis results as a ZIP archive with one CSV per section."""
+    if not _current_analysis:
+        raise HTTPException(status_code=404, detail="No analysis available.")
+    
+    filename = f"gpo_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    
+    # Streamed section by section; the frozen result is exported without a copy
+    return StreamingResponse(
+        export_to_zip_stream(_current_analysis),
+        media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
 @router.get("/export/pdf")
-async def export_pdf():
+async def export_pdf(request: Request):
     """Export analysis results to PDF."""
     if not _current_analysis:
         raise HTTPException(status_code=404, detail="No analysis available.")
     
+    etag = f'"{_current_analysis.fingerprint()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
     try:
-        # Use a copy to prevent state corruption
-        from copy import deepcopy
-        analysis_copy = deepcopy(_current_analysis)
-        pdf_content = export_to_pdf(analysis_copy)
+        # Not copied: the result is frozen and the PDF is cached per fingerprint
+        pdf_content = export_to_pdf(_current_analysis)
         
         filename = f"gpo_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
         return StreamingResponse(
             io.BytesIO(pdf_content),
             media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                "ETag": etag
+            }
         )
     except Exception as e:
         logger.error(f"PDF export error: {e}")
@@ -606,12 +629,50 @@ async def start_analysis(
     global _current_analysis, _current_session_gpo_ids
     
     try:
-        # Fetch selected GPOs
+        # Fetch selected GPOs and all of their settings with one query each
+        stored_gpos = {
+            sgpo.id: sgpo
+            for sgpo in session.exec(select(StoredGPO).where(StoredGPO.id.in_(gpo_ids)))
+        }
+        
+        # Settings are streamed in batches as plain column rows, skipping
+        # ORM instances, and converted as they arrive
+        setting_rows = session.exec(
+            select(
+                StoredSetting.gpo_id, StoredSetting.gpo_name, StoredSetting.category,
+                StoredSetting.name, StoredSetting.state, StoredSetting.value,
+                StoredSetting.registry_path, StoredSetting.registry_value, StoredSetting.scope,
+            )
+            .where(StoredSetting.gpo_id.in_(stored_gpos))
+            .execution_options(yield_per=1000)
+        )
+        settings_by_gpo = defaultdict(list)
+        for ss in setting_rows:
+            # Robust enum conversion
+            state_val = _POLICY_STATES.get(ss.state)
+            if state_val is None:
+                # Log warning, fallback
+                logger.warning(f"Invalid policy state '{ss.state}' for setting {ss.name}, defaulting to NOT_CONFIGURED")
+                state_val = PolicyState.NOT_CONFIGURED
+            
+            # Rows were validated when stored; only coalesce NULL columns
+            settings_by_gpo[ss.gpo_id].append(PolicySetting.model_construct(
+                gpo_id=ss.gpo_id,
+                gpo_name=ss.gpo_name,
+                category=ss.category,
+                name=ss.name,
+                state=state_val,
+                value=ss.value or "",
+                registry_path=ss.registry_path or "",
+                registry_value=ss.registry_value or "",
+                scope=ss.scope
+            ))
+        
         selected_gpos = []
         selected_settings = []
         
         for gid in gpo_ids:
-            sgpo = session.get(StoredGPO, gid)
+            sgpo = stored_gpos.get(gid)
             if sgpo:
                 gpo_info = GPOInfo(
                     id=sgpo.id,
@@ -626,28 +687,7 @@ async def start_analysis(
                     links=[l.model_dump() for l in sgpo.links]
                 )
                 selected_gpos.append(gpo_info)
-                
-                ssettings = session.exec(select(StoredSetting).where(StoredSetting.gpo_id == gid)).all()
-                for ss in ssettings:
-                    # Robust enum conversion
-                    try:
-                        state_val = PolicyState(ss.state)
-                    except ValueError:
-                        # Log warning, fallback
-                        logger.warning(f"Invalid policy state '{ss.state}' for setting {ss.name}, defaulting to NOT_CONFIGURED")
-                        state_val = PolicyState.NOT_CONFIGURED
-
-                    selected_settings.append(PolicySetting(
-                        gpo_id=ss.gpo_id,
-                        gpo_name=ss.gpo_name,
-                        category=ss.category,
-                        name=ss.name,
-                        state=state_val,
-                        value=ss.value,
-                        registry_path=ss.registry_path,
-                        registry_value=ss.registry_value,
-                        scope=ss.scope
-                    ))
+                selected_settings.extend(settings_by_gpo[gid])
 
         if not selected_gpos:
             raise HTTPException(status_code=404, detail="No valid GPOs found for the provided IDs.")
@@ -657,15 +697,9 @@ async def start_analysis(
         duplicates = detect_duplicates(selected_gpos, selected_settings)
         improvements = generate_improvements(selected_gpos, selected_settings)
         
-        # Calculate severity counts
-        critical_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.CRITICAL)
-        high_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.HIGH)
-        medium_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.MEDIUM)
-        low_count = sum(1 for i in conflicts + duplicates if i.severity == SeverityLevel.LOW)
-        
         # Update global state
         _current_session_gpo_ids = gpo_ids
-        _current_analysis = AnalysisResult(
+        _current_analysis = AnalysisResult.model_construct(
             analyzed_at=datetime.now(),
             gpo_count=len(selected_gpos),
             setting_count=len(selected_settings),
@@ -673,17 +707,10 @@ async def start_analysis(
             settings=selected_settings,
             conflicts=conflicts,
             duplicates=duplicates,
-            improvements=improvements,
-            conflict_count=len(conflicts),
-            duplicate_count=len(duplicates),
-            improvement_count=len(improvements),
-            critical_issues=critical_count,
-            high_issues=high_count,
-            medium_issues=medium_count,
-            low_issues=low_count
+            improvements=improvements
         )
         
-        return _current_analysis
+        return _analysis_response(_current_analysis)
         
     except HTTPException:
         raise
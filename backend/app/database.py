@@ -2,6 +2,7 @@
 # GPO Analysis Tool - Database Configuration
 # =============================================================================
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, create_engine, Session
 from pathlib import Path
 import logging
@@ -18,6 +19,26 @@ DATABASE_URL = f"sqlite:///{DB_PATH}"
 # check_same_thread=False is needed for SQLite with FastAPI
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
+# SQLite connection settings, applied to every new pooled connection.
+# WAL lets readers run alongside a writer, and with WAL synchronous=NORMAL
+# only syncs at checkpoints; it can lose the last commits on power loss,
+# but never corrupts the database.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",     # 64 MB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped reads
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite connection settings."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 def init_db():
     """Initialize the database and create tables."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,3 +1,6 @@
 # Exporters package
-from backend.app.exporters.csv_exporter import CSVExporter, export_to_csv
-from backend.app.exporters.pdf_exporter import PDFExporter, export_to_pdf
+from backend.app.exporters.csv_exporter import (
+    CSVExporter, export_to_csv, export_to_csv_file, export_to_csv_gzip, export_to_zip,
+    export_to_zip_stream
+)
+from backend.app.exporters.pdf_exporter import PDFExporter, export_to_pdf, export_to_pdf_file
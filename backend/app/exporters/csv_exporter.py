@@ -3,14 +3,55 @@
 # =============================================================================
 
 import csv
+import gzip
 import io
 import logging
+import zipfile
 from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, TextIO
 
+from backend.app.exporters.export_cache import ExportCache
 from backend.app.models.gpo import AnalysisResult
 
 logger = logging.getLogger(__name__)
 
+# Settings rows are a straight attribute grab (missing text is stored as "")
+_SETTING_ROW = attrgetter(
+    "gpo_name", "scope", "category", "name",
+    "state.value", "value", "registry_path", "registry_value"
+)
+
+# Combined CSV exports of recent analyses, as text and gzip-compressed
+_COMBINED_CACHE = ExportCache(maxsize=16)
+_GZIP_CACHE = ExportCache(maxsize=16)
+
+
+class _ChunkSink:
+    """
+    Write-only sink collecting bytes until they are drained.
+    
+    It has no seek(), so zipfile streams entries with data descriptors
+    instead of rewriting local headers.
+    """
+    
+    def __init__(self):
+        self._chunks: list[bytes] = []
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def drain(self) -> bytes:
+        """Return and forget everything written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 class CSVExporter:
     """Export analysis results to CSV format."""
@@ -25,14 +66,49 @@ class CSVExporter:
         Returns:
             Dictionary mapping filename to CSV content
         """
-        return {
-            "gpos.csv": self._export_gpos(),
-            "settings.csv": self._export_settings(),
-            "conflicts.csv": self._export_conflicts(),
-            "duplicates.csv": self._export_duplicates(),
-            "improvements.csv": self._export_improvements(),
-            "summary.csv": self._export_summary(),
-        }
+        return {name: self._render(write) for name, write in self._file_sections().items()}
+    
+    def export_zip(self, sink: BinaryIO) -> None:
+        """
+        Export all analysis data as a ZIP archive of CSV files.
+        
+        Each section is written straight into its archive entry, so no
+        section is ever held in memory as a string.
+        
+        Args:
+            sink: Writable binary file object receiving the archive
+        """
+        with self._open_zip(sink) as archive:
+            for name, write in self._file_sections().items():
+                self._write_zip_entry(archive, name, write)
+    
+    def iter_zip(self) -> Iterator[bytes]:
+        """
+        Yield the ZIP archive of CSV files one compressed section at a time.
+        
+        Nothing is buffered beyond the section being compressed, so
+        streaming consumers never hold the whole archive.
+        """
+        sink = _ChunkSink()
+        with self._open_zip(sink) as archive:
+            for name, write in self._file_sections().items():
+                self._write_zip_entry(archive, name, write)
+                yield sink.drain()
+        
+        # Closing the archive writes the central directory
+        yield sink.drain()
+    
+    @staticmethod
+    def _open_zip(sink: BinaryIO) -> zipfile.ZipFile:
+        """Open a ZIP archive for writing with fast compression."""
+        return zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+    
+    @staticmethod
+    def _write_zip_entry(archive: zipfile.ZipFile, name: str, write: Callable[[TextIO], None]) -> None:
+        """Write a section straight into its archive entry."""
+        entry = archive.open(name, "w", force_zip64=True)
+        with io.TextIOWrapper(entry, encoding="utf-8", newline="") as text:
+            write(text)
     
     def export_summary(self) -> str:
         """Export only summary information."""
@@ -44,42 +120,84 @@ class CSVExporter:
     
     def export_all_combined(self) -> str:
         """Export all data in a single CSV with section headers."""
-        output = io.StringIO()
+        return "".join(self.iter_combined())
+    
+    def iter_combined(self) -> Iterator[str]:
+        """
+        Yield the combined CSV one piece at a time.
         
+        Sections are rendered lazily, so streaming consumers only ever
+        hold a single section in memory. The blank line separating two
+        sections is carried by the next section header.
+        """
         # Summary section
-        output.write("=== GPO ANALYSIS SUMMARY ===\n")
-        output.write(self._export_summary())
-        output.write("\n")
+        yield "=== GPO ANALYSIS SUMMARY ===\n"
+        yield self._export_summary()
         
         # GPOs section
-        output.write("=== GROUP POLICY OBJECTS ===\n")
-        output.write(self._export_gpos())
-        output.write("\n")
+        yield "\n=== GROUP POLICY OBJECTS ===\n"
+        yield self._export_gpos()
         
         # All Settings section (new)
-        output.write("=== ALL POLICY SETTINGS ===\n")
-        output.write(self._export_settings())
-        output.write("\n")
+        yield "\n=== ALL POLICY SETTINGS ===\n"
+        yield self._export_settings()
         
         # Conflicts section
-        output.write("=== CONFLICTS ===\n")
-        output.write(self._export_conflicts())
-        output.write("\n")
+        yield "\n=== CONFLICTS ===\n"
+        yield self._export_conflicts()
         
         # Duplicates section
-        output.write("=== DUPLICATES ===\n")
-        output.write(self._export_duplicates())
-        output.write("\n")
+        yield "\n=== DUPLICATES ===\n"
+        yield self._export_duplicates()
         
         # Improvements section
-        output.write("=== IMPROVEMENT SUGGESTIONS ===\n")
-        output.write(self._export_improvements())
-        
+        yield "\n=== IMPROVEMENT SUGGESTIONS ===\n"
+        yield self._export_improvements()
+    
+    def _file_sections(self) -> dict[str, Callable[[TextIO], None]]:
+        """Map each per-file CSV name to the method writing its content."""
+        return {
+            "gpos.csv": self._write_gpos,
+            "settings.csv": self._write_settings,
+            "conflicts.csv": self._write_conflicts,
+            "duplicates.csv": self._write_duplicates,
+            "improvements.csv": self._write_improvements,
+            "summary.csv": self._write_summary,
+        }
+    
+    @staticmethod
+    def _render(write: Callable[[TextIO], None]) -> str:
+        """Run a section writer against an in-memory buffer and return the text."""
+        output = io.StringIO()
+        write(output)
         return output.getvalue()
     
     def _export_gpos(self) -> str:
         """Export GPO list to CSV."""
-        output = io.StringIO()
+        return self._render(self._write_gpos)
+    
+    def _export_settings(self) -> str:
+        """Export all settings to CSV."""
+        return self._render(self._write_settings)
+    
+    def _export_conflicts(self) -> str:
+        """Export conflicts to CSV."""
+        return self._render(self._write_conflicts)
+    
+    def _export_duplicates(self) -> str:
+        """Export duplicates to CSV."""
+        return self._render(self._write_duplicates)
+    
+    def _export_improvements(self) -> str:
+        """Export improvement suggestions to CSV."""
+        return self._render(self._write_improvements)
+    
+    def _export_summary(self) -> str:
+        """Export summary statistics to CSV."""
+        return self._render(self._write_summary)
+    
+    def _write_gpos(self, output: TextIO) -> None:
+        """Write GPO list as CSV."""
         writer = csv.writer(output)
         
         # Header
@@ -93,20 +211,17 @@ class CSVExporter:
             writer.writerow([
                 gpo.name,
                 gpo.id,
-                gpo.domain or "",
-                gpo.created.isoformat() if gpo.created else "",
-                gpo.modified.isoformat() if gpo.modified else "",
-                gpo.owner or "",
-                "Yes" if gpo.computer_enabled else "No",
-                "Yes" if gpo.user_enabled else "No",
+                gpo.domain,
+                gpo.created_iso,
+                gpo.modified_iso,
+                gpo.owner,
+                gpo.computer_enabled_str,
+                gpo.user_enabled_str,
                 gpo.source_file
             ])
-        
-        return output.getvalue()
     
-    def _export_settings(self) -> str:
-        """Export all settings to CSV."""
-        output = io.StringIO()
+    def _write_settings(self, output: TextIO) -> None:
+        """Write all settings as CSV."""
         writer = csv.writer(output)
         
         # Header
@@ -116,23 +231,10 @@ class CSVExporter:
         ])
         
         # Data
-        for setting in self.result.settings:
-            writer.writerow([
-                setting.gpo_name,
-                setting.scope,
-                setting.category,
-                setting.name,
-                setting.state.value,
-                setting.value or "",
-                setting.registry_path or "",
-                setting.registry_value or ""
-            ])
-        
-        return output.getvalue()
+        writer.writerows(map(_SETTING_ROW, self.result.settings))
     
-    def _export_conflicts(self) -> str:
-        """Export conflicts to CSV."""
-        output = io.StringIO()
+    def _write_conflicts(self, output: TextIO) -> None:
+        """Write conflicts as CSV."""
         writer = csv.writer(output)
         
         # Header
@@ -143,7 +245,7 @@ class CSVExporter:
         
         # Data
         for conflict in self.result.conflicts:
-            gpo_list = ", ".join(set(p.gpo_name for p in conflict.conflicting_policies))
+            gpo_list = ", ".join(dict.fromkeys(p.gpo_name for p in conflict.conflicting_policies))
             writer.writerow([
                 conflict.severity.value.upper(),
                 conflict.setting_name,
@@ -154,12 +256,9 @@ class CSVExporter:
                 conflict.description,
                 conflict.recommendation
             ])
-        
-        return output.getvalue()
     
-    def _export_duplicates(self) -> str:
-        """Export duplicates to CSV."""
-        output = io.StringIO()
+    def _write_duplicates(self, output: TextIO) -> None:
+        """Write duplicates as CSV."""
         writer = csv.writer(output)
         
         # Header
@@ -178,12 +277,9 @@ class CSVExporter:
                 duplicate.description,
                 duplicate.recommendation
             ])
-        
-        return output.getvalue()
     
-    def _export_improvements(self) -> str:
-        """Export improvement suggestions to CSV."""
-        output = io.StringIO()
+    def _write_improvements(self, output: TextIO) -> None:
+        """Write improvement suggestions as CSV."""
         writer = csv.writer(output)
         
         # Header
@@ -204,12 +300,9 @@ class CSVExporter:
                 improvement.estimated_impact,
                 improvement.reference_url or ""
             ])
-        
-        return output.getvalue()
     
-    def _export_summary(self) -> str:
-        """Export summary statistics to CSV."""
-        output = io.StringIO()
+    def _write_summary(self, output: TextIO) -> None:
+        """Write summary statistics as CSV."""
         writer = csv.writer(output)
         
         writer.writerow(["Metric", "Value"])
@@ -223,8 +316,6 @@ class CSVExporter:
         writer.writerow(["High Priority Issues", self.result.high_issues])
         writer.writerow(["Medium Priority Issues", self.result.medium_issues])
         writer.writerow(["Low Priority Issues", self.result.low_issues])
-        
-        return output.getvalue()
 
 
 def export_to_csv(result: AnalysisResult, combined: bool = True) -> str | dict[str, str]:
@@ -237,5 +328,94 @@ def export_to_csv(result: AnalysisResult, combined: bool = True) -> str | dict[s
     """
     exporter = CSVExporter(result)
     if combined:
-        return exporter.export_all_combined()
+        return _COMBINED_CACHE.get_or_create(result.fingerprint(), exporter.export_all_combined)
     return exporter.export_all()
+
+
+def export_to_csv_file(result: AnalysisResult, path: Path) -> Path:
+    """
+    Write the combined CSV export straight to disk.
+    
+    A combined export already cached for this analysis is written as-is.
+    Otherwise sections are streamed into the file as they are rendered,
+    and the cache is not filled: that would mean joining the whole export
+    into one string, which streaming avoids.
+    
+    Args:
+        result: Analysis result to export
+        path: Destination file
+        
+    Returns:
+        The path written to
+    """
+    cached = _COMBINED_CACHE.get(result.fingerprint())
+    with open(path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as f:
+        if cached is not None:
+            f.write(cached)
+        else:
+            f.writelines(CSVExporter(result).iter_combined())
+    return path
+
+
+def export_to_zip(result: AnalysisResult, sink: BinaryIO) -> None:
+    """
+    Convenience function for ZIP export.
+    
+    Args:
+        result: Analysis result to export
+        sink: Writable binary file object receiving the archive
+    """
+    CSVExporter(result).export_zip(sink)
+
+
+def export_to_zip_stream(result: AnalysisResult) -> Iterator[bytes]:
+    """
+    Stream the ZIP export as archive chunks.
+    
+    Args:
+        result: Analysis result to export
+        
+    Yields:
+        Chunks of the archive, one per section plus the central directory
+    """
+    return CSVExporter(result).iter_zip()
+
+
+def export_to_csv_gzip(result: AnalysisResult) -> Iterator[bytes]:
+    """
+    Stream the combined CSV export as gzip-compressed chunks.
+    
+    The CSV columns are highly repetitive (severity, scope, category), so
+    even the fastest compression level shrinks downloads considerably.
+    The first export of an analysis is streamed as it is compressed and
+    then cached, so repeated downloads send the stored bytes.
+    
+    Args:
+        result: Analysis result to export
+        
+    Yields:
+        Chunks of the gzip stream, ready to be sent as-is
+    """
+    key = result.fingerprint()
+    cached = _GZIP_CACHE.get(key)
+    if cached is not None:
+        yield cached
+        return
+    
+    exporter = CSVExporter(result)
+    sink = io.BytesIO()
+    chunks = []
+    
+    with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=1, mtime=0) as gz:
+        for chunk in exporter.iter_combined():
+            gz.write(chunk.encode("utf-8"))
+            if sink.tell():
+                chunks.append(sink.getvalue())
+                yield chunks[-1]
+                sink.seek(0)
+                sink.truncate()
+    
+    # Closing the GzipFile flushes the last block and the CRC trailer
+    chunks.append(sink.getvalue())
+    yield chunks[-1]
+    _GZIP_CACHE.put(key, b"".join(chunks))
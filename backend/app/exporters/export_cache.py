@@ -0,0 +1,52 @@
+# =============================================================================
+# Export Cache - Reuse rendered exports for an unchanged analysis result
+# =============================================================================
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class ExportCache:
+    """
+    Small thread-safe LRU cache of rendered exports.
+    
+    Exports are pure functions of the analysis result, so they are keyed
+    on AnalysisResult.fingerprint() and a repeated download of the same
+    analysis skips regeneration entirely.
+    """
+    
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_create(self, key: str, create: Callable[[], Any]) -> Any:
+        """Return the cached export for key, rendering it with create() on a miss."""
+        value = self.get(key)
+        if value is None:
+            # Render outside the lock so slow exports don't serialize each other
+            value = create()
+            self.put(key, value)
+        return value
+    
+    def get(self, key: str) -> Any:
+        """Return the cached export for key, or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        return None
+    
+    def put(self, key: str, value: Any) -> None:
+        """Cache an export rendered by the caller (e.g. while streaming it)."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached exports."""
+        with self._lock:
+            self._entries.clear()
@@ -4,63 +4,120 @@
 
 import io
 import logging
+import threading
 from datetime import datetime
+from html import escape
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
-
+from backend.app.exporters.export_cache import ExportCache
 from backend.app.models.gpo import AnalysisResult, SeverityLevel
 
+# WeasyPrint is imported lazily: loading it initializes Pango/cairo/fontconfig,
+# which processes that never render a PDF should not pay for
+if TYPE_CHECKING:
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
 logger = logging.getLogger(__name__)
 
+# Rendered PDFs of recent analyses
+_PDF_CACHE = ExportCache(maxsize=16)
+
+# FontConfiguration triggers a fontconfig cache lookup, so share one instance
+_FONT_CONFIG: Optional["FontConfiguration"] = None
+_FONT_CONFIG_LOCK = threading.Lock()
+
+
+def _get_font_config() -> "FontConfiguration":
+    """Return the shared font configuration, creating it on first use."""
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        with _FONT_CONFIG_LOCK:
+            if _FONT_CONFIG is None:
+                from weasyprint.text.fonts import FontConfiguration
+                _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+# The stylesheet never changes, so it is parsed once and reused
+_STYLESHEET: Optional["CSS"] = None
+_STYLESHEET_LOCK = threading.Lock()
+
+
+def _get_stylesheet() -> "CSS":
+    """Return the parsed report stylesheet, parsing it on first use."""
+    global _STYLESHEET
+    if _STYLESHEET is None:
+        with _STYLESHEET_LOCK:
+            if _STYLESHEET is None:
+                from weasyprint import CSS
+                _STYLESHEET = CSS(string=_REPORT_CSS, font_config=_get_font_config())
+    return _STYLESHEET
+
+
+# English month names for the cover date (avoids locale-aware strftime)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Static document shell; the rendered sections are dropped into {body}
+_HTML_SHELL = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>GPO Analysis Report</title>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
 
 class PDFExporter:
     """Export analysis results to professional PDF report."""
     
     def __init__(self, result: AnalysisResult):
         self.result = result
-        self.font_config = FontConfiguration()
+        self.font_config = _get_font_config()
     
     def export(self) -> bytes:
         """Generate PDF report and return as bytes."""
+        from weasyprint import HTML
+        
         html_content = self._generate_html()
-        css_content = self._get_css()
         
         html = HTML(string=html_content)
-        css = CSS(string=css_content, font_config=self.font_config)
-        
-        pdf_bytes = html.write_pdf(stylesheets=[css])
+        pdf_bytes = html.write_pdf(stylesheets=[_get_stylesheet()])
         
         logger.info("PDF report generated successfully")
         return pdf_bytes
     
     def _generate_html(self) -> str:
         """Generate HTML content for the PDF."""
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>GPO Analysis Report</title>
-</head>
-<body>
-    {self._render_cover_page()}
-    {self._render_executive_summary()}
-    {self._render_gpo_inventory()}
-    {self._render_conflicts()}
-    {self._render_duplicates()}
-    {self._render_improvements()}
-</body>
-</html>
-"""
+        return _HTML_SHELL.format(body="".join((
+            self._render_cover_page(),
+            self._render_executive_summary(),
+            self._render_gpo_inventory(),
+            self._render_conflicts(),
+            self._render_duplicates(),
+            self._render_improvements(),
+        )))
     
     def _render_cover_page(self) -> str:
         """Render cover page."""
+        analyzed_at = self.result.analyzed_at
+        cover_date = f"{_MONTHS[analyzed_at.month - 1]} {analyzed_at.day:02d}, {analyzed_at.year}"
+        
         return f"""
 <div class="cover-page">
     <div class="cover-content">
         <h1 class="cover-title">Group Policy Object<br>Analysis Report</h1>
-        <div class="cover-date">{self.result.analyzed_at.strftime('%B %d, %Y')}</div>
+        <div class="cover-date">{cover_date}</div>
         <div class="cover-stats">
             <div class="cover-stat">
                 <span class="stat-value">{self.result.gpo_count}</span>
@@ -132,12 +189,12 @@ class PDFExporter:
             return ""
         
         rows = ""
-        for gpo in self.result.gpos[:20]:  # Limit to 20 for PDF
+        for gpo in islice(self.result.gpos, 20):  # Limit to 20 for PDF
             rows += f"""
 <tr>
-    <td>{gpo.name}</td>
-    <td>{gpo.domain or 'N/A'}</td>
-    <td>{gpo.modified.strftime('%Y-%m-%d') if gpo.modified else 'N/A'}</td>
+    <td>{escape(gpo.name)}</td>
+    <td>{escape(gpo.domain or 'N/A')}</td>
+    <td>{gpo.modified_ymd}</td>
 </tr>
 """
         
@@ -176,18 +233,18 @@ class PDFExporter:
 """
         
         rows = ""
-        for conflict in self.result.conflicts[:15]:  # Limit for PDF
+        for conflict in islice(self.result.conflicts, 15):  # Limit for PDF
             severity_class = conflict.severity.value
-            gpo_list = ", ".join(set(p.gpo_name for p in conflict.conflicting_policies[:3]))
+            gpo_list = ", ".join(dict.fromkeys(p.gpo_name for p in conflict.conflicting_policies[:3]))
             if len(conflict.conflicting_policies) > 3:
                 gpo_list += f" (+{len(conflict.conflicting_policies) - 3} more)"
             
             rows += f"""
 <tr>
     <td><span class="badge {severity_class}">{conflict.severity.value.upper()}</span></td>
-    <td>{conflict.setting_name}</td>
-    <td>{gpo_list}</td>
-    <td>{conflict.winning_gpo or 'N/A'}</td>
+    <td>{escape(conflict.setting_name)}</td>
+    <td>{escape(gpo_list)}</td>
+    <td>{escape(conflict.winning_gpo or 'N/A')}</td>
 </tr>
 """
         
@@ -223,7 +280,7 @@ class PDFExporter:
 """
         
         rows = ""
-        for dup in self.result.duplicates[:15]:
+        for dup in islice(self.result.duplicates, 15):
             gpo_list = ", ".join(dup.affected_gpos[:3])
             if len(dup.affected_gpos) > 3:
                 gpo_list += f" (+{len(dup.affected_gpos) - 3} more)"
@@ -231,8 +288,8 @@ class PDFExporter:
             rows += f"""
 <tr>
     <td><span class="badge {dup.severity.value}">{dup.severity.value.upper()}</span></td>
-    <td>{dup.setting_name}</td>
-    <td>{gpo_list}</td>
+    <td>{escape(dup.setting_name)}</td>
+    <td>{escape(gpo_list)}</td>
 </tr>
 """
         
@@ -267,16 +324,16 @@ class PDFExporter:
 """
         
         items = ""
-        for improvement in self.result.improvements[:10]:
+        for improvement in islice(self.result.improvements, 10):
             items += f"""
 <div class="improvement-card">
     <div class="improvement-header">
         <span class="badge {improvement.severity.value}">{improvement.severity.value.upper()}</span>
         <span class="improvement-category">{improvement.category.value.upper()}</span>
     </div>
-    <h4>{improvement.title}</h4>
-    <p class="improvement-desc">{improvement.description}</p>
-    <p class="improvement-action"><strong>Action:</strong> {improvement.action}</p>
+    <h4>{escape(improvement.title)}</h4>
+    <p class="improvement-desc">{escape(improvement.description)}</p>
+    <p class="improvement-action"><strong>Action:</strong> {escape(improvement.action)}</p>
 </div>
 """
         
@@ -287,10 +344,10 @@ class PDFExporter:
     {items}
 </section>
 """
-    
-    def _get_css(self) -> str:
-        """Return CSS styles for the PDF."""
-        return """
+
+
+# Report stylesheet, parsed once by _get_stylesheet()
+_REPORT_CSS = """
 @page {
     size: A4;
     margin: 2cm;
@@ -509,6 +566,25 @@ body {
 
 
 def export_to_pdf(result: AnalysisResult) -> bytes:
-    """Convenience function for PDF export."""
-    exporter = PDFExporter(result)
-    return exporter.export()
+    """Convenience function for PDF export (cached per analysis)."""
+    return _PDF_CACHE.get_or_create(
+        result.fingerprint(), lambda: PDFExporter(result).export()
+    )
+
+
+def export_to_pdf_file(result: AnalysisResult, path: Path) -> Path:
+    """
+    Write the PDF report straight to disk.
+    
+    WeasyPrint produces the whole document in one buffer, which is handed
+    to the OS in a single write.
+    
+    Args:
+        result: Analysis result to export
+        path: Destination file
+        
+    Returns:
+        The path written to
+    """
+    path.write_bytes(export_to_pdf(result))
+    return path
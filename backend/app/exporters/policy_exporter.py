@@ -2,15 +2,149 @@
 # Policy Exporter - Export recommended policy as deployable PowerShell GPO script
 # =============================================================================
 
-import io
 import logging
 from datetime import datetime
 from typing import Optional
 
-from backend.app.models.gpo import AnalysisResult, ImprovementSuggestion, ImprovementCategory
+from backend.app.models.gpo import AnalysisResult, ImprovementSuggestion, ImprovementCategory, SeverityLevel
 
 logger = logging.getLogger(__name__)
 
+# Invariant parts of the generated script. {timestamp} is the only
+# placeholder; literal PowerShell braces are doubled for str.format().
+_SCRIPT_HEADER = """\
+# =============================================================================
+# GPO Analysis Tool - Recommended Policy Script
+# Generated: {timestamp}
+# =============================================================================
+#
+# This script contains recommended GPO settings based on best practices.
+# Review each section carefully before applying to your environment.
+#
+# USAGE:
+#   1. Review the settings below
+#   2. Modify GPO_NAME to match your target GPO
+#   3. Run in an elevated PowerShell session with RSAT installed
+#
+# =============================================================================
+
+#Requires -Modules GroupPolicy
+
+# Configuration - modify these values
+$GPO_NAME = "YOUR-GPO-NAME"  # Replace with your target GPO name
+$DOMAIN = $env:USERDNSDOMAIN  # Or specify manually
+
+# Safety check
+$confirm = Read-Host "This script will modify GPO settings. Type YES to continue"
+if ($confirm -ne "YES") {{
+    Write-Host "Aborted by user." -ForegroundColor Yellow
+    exit
+}}
+
+# Initialize
+$successCount = 0
+$errorCount = 0
+Write-Host "Applying recommended policy settings..." -ForegroundColor Cyan
+
+"""
+
+_SCRIPT_FOOTER = (
+    "\n# =============================================================================\n"
+    "# Summary\n"
+    "# =============================================================================\n"
+    'Write-Host ""`n'
+    'Write-Host "Policy application complete." -ForegroundColor Green\n'
+    'Write-Host "Successfully applied: $successCount setting(s)"\n'
+    'Write-Host "Errors encountered: $errorCount"\n'
+    'Write-Host ""`n'
+    'Write-Host "IMPORTANT: Review the GPO in Group Policy Management Console to verify changes." -ForegroundColor Yellow\n'
+)
+
+_SECTION_RULE = "# -----------------------------------------------------------------------------\n"
+
+# Comment block heading each recommended setting; {reference} is either
+# empty or a complete "# Reference: ..." line
+_ROW_TEMPLATE = (
+    _SECTION_RULE
+    + "# [{index}] {title}\n"
+    "# Severity: {severity}\n"
+    "{reference}"
+    "# Description: {description}\n"
+    + _SECTION_RULE
+)
+
+# Improvement categories that translate into policy settings
+_RECOMMENDED_CATEGORIES = frozenset({ImprovementCategory.SECURITY, ImprovementCategory.PERFORMANCE})
+
+# Upper-case severity labels keyed by enum member
+_SEVERITY_LABELS = {level: level.value.upper() for level in SeverityLevel}
+
+
+# Commands for settings recognised from the suggestion title
+_PASSWORD_LENGTH_TEMPLATE = (
+    '    # Setting: Minimum Password Length\n'
+    '    # This requires domain-level password policy changes\n'
+    '    Write-Host "  Setting minimum password length..." -NoNewline\n'
+    '    # Manual action required - use Active Directory Administrative Center\n'
+    '    # or Set-ADDefaultDomainPasswordPolicy cmdlet\n'
+    '    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n'
+)
+
+_LOCKOUT_TEMPLATE = (
+    '    # Setting: Account Lockout Policy\n'
+    '    Write-Host "  Configuring account lockout policy..." -NoNewline\n'
+    '    # Manual action required - use Active Directory Administrative Center\n'
+    '    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n'
+)
+
+_PASSWORD_AGE_TEMPLATE = (
+    '    # Setting: Maximum Password Age\n'
+    '    Write-Host "  Setting maximum password age..." -NoNewline\n'
+    '    # Manual action required - domain password policy\n'
+    '    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n'
+)
+
+_ADMIN_ACCOUNT_TEMPLATE = (
+    '    # Setting: Administrator Account Status\n'
+    '    Write-Host "  Configuring administrator account..." -NoNewline\n'
+    '    # Set via: Computer Configuration > Windows Settings > Security Settings > Local Policies > Security Options\n'
+    '    Set-GPRegistryValue -Name $GPO_NAME -Key "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" `\n'
+    '        -ValueName "EnableLUA" -Type DWord -Value 1 -ErrorAction Stop\n'
+    '    Write-Host " [OK]" -ForegroundColor Green\n'
+    '    $successCount++\n'
+)
+
+# Checked in order: (keywords that must all appear in the lowercased title, command)
+_SETTING_TEMPLATES = (
+    (("password length",), _PASSWORD_LENGTH_TEMPLATE),
+    (("lockout",), _LOCKOUT_TEMPLATE),
+    (("password age",), _PASSWORD_AGE_TEMPLATE),
+    (("admin", "account"), _ADMIN_ACCOUNT_TEMPLATE),
+)
+
+# Fallback for settings that need manual configuration
+_GENERIC_TEMPLATE = (
+    "    # Setting: {title}\n"
+    '    Write-Host "  Applying: {short_title}..." -NoNewline\n'
+    "    # This setting requires manual configuration\n"
+    "    # Action: {action}\n"
+    '    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n'
+)
+
+_CATCH_BLOCK = (
+    "}\n"
+    "catch {\n"
+    '    Write-Host " [ERROR]" -ForegroundColor Red\n'
+    '    Write-Host "    $_" -ForegroundColor Red\n'
+    "    $errorCount++\n"
+    "}\n"
+)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
 
 class PolicyExporter:
     """
@@ -30,135 +164,73 @@ class PolicyExporter:
         Returns:
             PowerShell script content as string
         """
-        output = io.StringIO()
+        parts: list[str] = []
         
-        # Script header
-        output.write("# =============================================================================\n")
-        output.write("# GPO Analysis Tool - Recommended Policy Script\n")
-        output.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        output.write("# =============================================================================\n")
-        output.write("#\n")
-        output.write("# This script contains recommended GPO settings based on best practices.\n")
-        output.write("# Review each section carefully before applying to your environment.\n")
-        output.write("#\n")
-        output.write("# USAGE:\n")
-        output.write("#   1. Review the settings below\n")
-        output.write("#   2. Modify GPO_NAME to match your target GPO\n")
-        output.write("#   3. Run in an elevated PowerShell session with RSAT installed\n")
-        output.write("#\n")
-        output.write("# =============================================================================\n\n")
-        
-        # Configuration section
-        output.write("#Requires -Modules GroupPolicy\n\n")
-        output.write("# Configuration - modify these values\n")
-        output.write('$GPO_NAME = "YOUR-GPO-NAME"  # Replace with your target GPO name\n')
-        output.write('$DOMAIN = $env:USERDNSDOMAIN  # Or specify manually\n\n')
-        
-        # Safety prompt
-        output.write("# Safety check\n")
-        output.write('$confirm = Read-Host "This script will modify GPO settings. Type YES to continue"\n')
-        output.write('if ($confirm -ne "YES") {\n')
-        output.write('    Write-Host "Aborted by user." -ForegroundColor Yellow\n')
-        output.write("    exit\n")
-        output.write("}\n\n")
-        
-        # Initialize counters
-        output.write("# Initialize\n")
-        output.write("$successCount = 0\n")
-        output.write("$errorCount = 0\n")
-        output.write('Write-Host "Applying recommended policy settings..." -ForegroundColor Cyan\n\n')
+        # Script header, configuration, safety prompt and counters
+        parts.append(_SCRIPT_HEADER.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
         
         # Get security and performance improvements
         security_improvements = [
-            i for i in self.result.improvements 
-            if i.category in [ImprovementCategory.SECURITY, ImprovementCategory.PERFORMANCE]
+            i for i in self.result.improvements
+            if i.category in _RECOMMENDED_CATEGORIES
         ]
         
         if not security_improvements:
-            output.write("# No security or performance improvements to apply.\n")
-            output.write('Write-Host "No recommended settings found." -ForegroundColor Yellow\n')
+            parts.append("# No security or performance improvements to apply.\n")
+            parts.append('Write-Host "No recommended settings found." -ForegroundColor Yellow\n')
         else:
-            output.write(f"# {len(security_improvements)} recommended setting(s) to apply\n\n")
+            parts.append(f"# {len(security_improvements)} recommended setting(s) to apply\n\n")
+            
+            rows = [
+                (i, improvement, _truncate(improvement.description, 100))
+                for i, improvement in enumerate(security_improvements, 1)
+            ]
             
-            for i, improvement in enumerate(security_improvements, 1):
-                output.write(f"# -----------------------------------------------------------------------------\n")
-                output.write(f"# [{i}] {improvement.title}\n")
-                output.write(f"# Severity: {improvement.severity.value.upper()}\n")
-                if improvement.reference_url:
-                    output.write(f"# Reference: {improvement.reference_url}\n")
-                output.write(f"# Description: {improvement.description[:100]}...\n" if len(improvement.description) > 100 else f"# Description: {improvement.description}\n")
-                output.write(f"# -----------------------------------------------------------------------------\n")
+            append = parts.append
+            format_row = _ROW_TEMPLATE.format
+            write_command = self._write_setting_command
+            for i, improvement, description in rows:
+                title, severity, reference_url = improvement.title, improvement.severity, improvement.reference_url
+                append(format_row(
+                    index=i,
+                    title=title,
+                    severity=_SEVERITY_LABELS[severity],
+                    reference=f"# Reference: {reference_url}\n" if reference_url else "",
+                    description=description,
+                ))
                 
                 # Generate setting-specific commands
-                self._write_setting_command(output, improvement)
-                output.write("\n")
+                write_command(parts, improvement)
+                append("\n")
         
         # Summary section
-        output.write("\n# =============================================================================\n")
-        output.write("# Summary\n")
-        output.write("# =============================================================================\n")
-        output.write('Write-Host ""`n')
-        output.write('Write-Host "Policy application complete." -ForegroundColor Green\n')
-        output.write('Write-Host "Successfully applied: $successCount setting(s)"\n')
-        output.write('Write-Host "Errors encountered: $errorCount"\n')
-        output.write('Write-Host ""`n')
-        output.write('Write-Host "IMPORTANT: Review the GPO in Group Policy Management Console to verify changes." -ForegroundColor Yellow\n')
+        parts.append(_SCRIPT_FOOTER)
         
-        return output.getvalue()
+        return "".join(parts)
     
-    def _write_setting_command(self, output: io.StringIO, improvement: ImprovementSuggestion) -> None:
-        """Write PowerShell command for a specific improvement."""
+    def _write_setting_command(self, parts: list[str], improvement: ImprovementSuggestion) -> None:
+        """Append PowerShell command for a specific improvement to parts."""
         
         # Extract setting info from title/description
         # Format varies, but we try to extract key info
         title_lower = improvement.title.lower()
         
-        output.write("try {\n")
+        parts.append("try {\n")
         
         # Check for known setting patterns
-        if "password length" in title_lower:
-            output.write('    # Setting: Minimum Password Length\n')
-            output.write('    # This requires domain-level password policy changes\n')
-            output.write('    Write-Host "  Setting minimum password length..." -NoNewline\n')
-            output.write('    # Manual action required - use Active Directory Administrative Center\n')
-            output.write('    # or Set-ADDefaultDomainPasswordPolicy cmdlet\n')
-            output.write('    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n')
-            
-        elif "lockout" in title_lower:
-            output.write('    # Setting: Account Lockout Policy\n')
-            output.write('    Write-Host "  Configuring account lockout policy..." -NoNewline\n')
-            output.write('    # Manual action required - use Active Directory Administrative Center\n')
-            output.write('    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n')
-            
-        elif "password age" in title_lower:
-            output.write('    # Setting: Maximum Password Age\n')
-            output.write('    Write-Host "  Setting maximum password age..." -NoNewline\n')
-            output.write('    # Manual action required - domain password policy\n')
-            output.write('    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n')
-            
-        elif "admin" in title_lower and "account" in title_lower:
-            output.write('    # Setting: Administrator Account Status\n')
-            output.write('    Write-Host "  Configuring administrator account..." -NoNewline\n')
-            output.write('    # Set via: Computer Configuration > Windows Settings > Security Settings > Local Policies > Security Options\n')
-            output.write('    Set-GPRegistryValue -Name $GPO_NAME -Key "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" `\n')
-            output.write('        -ValueName "EnableLUA" -Type DWord -Value 1 -ErrorAction Stop\n')
-            output.write('    Write-Host " [OK]" -ForegroundColor Green\n')
-            output.write('    $successCount++\n')
-            
+        for keywords, template in _SETTING_TEMPLATES:
+            if all(keyword in title_lower for keyword in keywords):
+                parts.append(template)
+                break
         else:
             # Generic handler for unknown settings
-            output.write(f'    # Setting: {improvement.title}\n')
-            output.write(f'    Write-Host "  Applying: {improvement.title[:50]}..." -NoNewline\n')
-            output.write('    # This setting requires manual configuration\n')
-            output.write(f'    # Action: {improvement.action[:80]}...\n' if len(improvement.action) > 80 else f'    # Action: {improvement.action}\n')
-            output.write('    Write-Host " [MANUAL ACTION REQUIRED]" -ForegroundColor Yellow\n')
+            parts.append(_GENERIC_TEMPLATE.format(
+                title=improvement.title,
+                short_title=improvement.title[:50],
+                action=_truncate(improvement.action, 80)
+            ))
         
-        output.write("}\n")
-        output.write("catch {\n")
-        output.write(f'    Write-Host " [ERROR]" -ForegroundColor Red\n')
-        output.write('    Write-Host "    $_" -ForegroundColor Red\n')
-        output.write('    $errorCount++\n')
-        output.write("}\n")
+        parts.append(_CATCH_BLOCK)
 
 
 def export_recommended_policy(result: AnalysisResult) -> str:
@@ -8,10 +8,11 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 
 from backend.app.api.routes import router
 from backend.app.database import init_db
+from backend.app.static_files import CachedStaticFiles
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +27,9 @@ UPLOADS_DIR = BASE_DIR / "uploads"
 EXPORTS_DIR = BASE_DIR / "exports"
 STATIC_DIR = BASE_DIR / "static"
 
+# Frontend file server, mounted below when STATIC_DIR exists
+static_files = CachedStaticFiles(directory=str(STATIC_DIR), html=True)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -37,6 +41,8 @@ async def lifespan(app: FastAPI):
     EXPORTS_DIR.mkdir(exist_ok=True)
     logger.info(f"Uploads directory: {UPLOADS_DIR}")
     logger.info(f"Exports directory: {EXPORTS_DIR}")
+    if STATIC_DIR.exists():
+        logger.info(f"Static files cached: {static_files.preload()}")
     
     yield
     
@@ -50,6 +56,7 @@ app = FastAPI(
     description="Cross-platform Active Directory Group Policy Object analyzer",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json"
@@ -69,7 +76,7 @@ app.include_router(router, prefix="/api")
 
 # Serve static files (frontend) if directory exists
 if STATIC_DIR.exists():
-    app.mount("/", StaticFiles(directory=str(STATIC_DIR), html=True), name="static")
+    app.mount("/", static_files, name="static")
 
 
 @app.get("/api/health")
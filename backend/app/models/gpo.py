@@ -2,10 +2,26 @@
 # GPO Analysis Tool - Pydantic Models
 # =============================================================================
 
+import hashlib
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Annotated, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
+
+
+# Free-text attributes that may be missing from a report. They are stored as
+# "" rather than None so exporters can write them out without coalescing;
+# None is still accepted on input (parsers, database rows, saved analyses).
+OptionalText = Annotated[str, BeforeValidator(lambda v: "" if v is None else v)]
+
+# Analysis output is never modified once built. Freezing it lets exporters and
+# caches share instances safely and allows model_construct() on trusted paths.
+# GPOInfo stays mutable because parsers fill in its metadata incrementally.
+# Field values live in each instance's __dict__; pydantic v2 has no slotted
+# model option, so __slots__ declared on these classes would not hold them.
+_FROZEN = ConfigDict(frozen=True)
 
 
 class SeverityLevel(str, Enum):
@@ -36,31 +52,66 @@ class GPOInfo(BaseModel):
     """Basic GPO metadata extracted from reports."""
     id: str = Field(..., description="Unique identifier (usually GUID)")
     name: str = Field(..., description="Display name of the GPO")
-    domain: Optional[str] = Field(default=None)
+    domain: OptionalText = Field(default="")
     created: Optional[datetime] = Field(default=None)
     modified: Optional[datetime] = Field(default=None)
-    owner: Optional[str] = Field(default=None)
+    owner: OptionalText = Field(default="")
     links: list[GPOLink] = Field(default_factory=list)
     computer_enabled: bool = Field(default=True)
     user_enabled: bool = Field(default=True)
     source_file: str = Field(..., description="Original source file path")
+    
+    # Export-ready representations shared by all exporters. GPOInfo is
+    # mutable, so they are recomputed on each access rather than cached.
+    
+    @property
+    def created_iso(self) -> str:
+        """Creation time in ISO 8601 format, or empty string."""
+        return self.created.isoformat() if self.created else ""
+    
+    @property
+    def modified_iso(self) -> str:
+        """Modification time in ISO 8601 format, or empty string."""
+        return self.modified.isoformat() if self.modified else ""
+    
+    @property
+    def modified_ymd(self) -> str:
+        """Modification date as YYYY-MM-DD, or 'N/A'."""
+        if not self.modified:
+            return "N/A"
+        m = self.modified
+        return f"{m.year:04d}-{m.month:02d}-{m.day:02d}"
+    
+    @property
+    def computer_enabled_str(self) -> str:
+        """Computer configuration status as Yes/No."""
+        return "Yes" if self.computer_enabled else "No"
+    
+    @property
+    def user_enabled_str(self) -> str:
+        """User configuration status as Yes/No."""
+        return "Yes" if self.user_enabled else "No"
 
 
 class PolicySetting(BaseModel):
     """Individual policy setting within a GPO."""
+    model_config = _FROZEN
+    
     gpo_id: str = Field(..., description="Parent GPO identifier")
     gpo_name: str = Field(..., description="Parent GPO name")
     category: str = Field(..., description="Policy category path")
     name: str = Field(..., description="Policy setting name")
     state: PolicyState = Field(default=PolicyState.NOT_CONFIGURED)
-    value: Optional[str] = Field(default=None, description="Configured value if applicable")
-    registry_path: Optional[str] = Field(default=None, description="Associated registry key")
-    registry_value: Optional[str] = Field(default=None, description="Registry value name")
+    value: OptionalText = Field(default="", description="Configured value if applicable")
+    registry_path: OptionalText = Field(default="", description="Associated registry key")
+    registry_value: OptionalText = Field(default="", description="Registry value name")
     scope: str = Field(default="Computer", description="Computer or User configuration")
 
 
 class ConflictReport(BaseModel):
     """Report of conflicting settings between GPOs."""
+    model_config = _FROZEN
+    
     id: str = Field(..., description="Unique conflict identifier")
     severity: SeverityLevel = Field(default=SeverityLevel.MEDIUM)
     setting_name: str = Field(..., description="Name of the conflicting setting")
@@ -89,6 +140,8 @@ class ConflictReport(BaseModel):
 
 class DuplicateReport(BaseModel):
     """Report of duplicate/redundant policies."""
+    model_config = _FROZEN
+    
     id: str = Field(..., description="Unique duplicate identifier")
     severity: SeverityLevel = Field(default=SeverityLevel.LOW)
     setting_name: str = Field(..., description="Name of the duplicated setting")
@@ -118,6 +171,8 @@ class ImprovementCategory(str, Enum):
 
 class ImprovementSuggestion(BaseModel):
     """Recommendation for GPO improvement."""
+    model_config = _FROZEN
+    
     id: str = Field(..., description="Unique suggestion identifier")
     category: ImprovementCategory
     severity: SeverityLevel = Field(default=SeverityLevel.INFO)
@@ -131,6 +186,8 @@ class ImprovementSuggestion(BaseModel):
 
 class AnalysisResult(BaseModel):
     """Complete analysis result for a set of GPOs."""
+    model_config = _FROZEN
+    
     analyzed_at: datetime = Field(default_factory=datetime.now)
     gpo_count: int = Field(default=0)
     setting_count: int = Field(default=0)
@@ -141,15 +198,74 @@ class AnalysisResult(BaseModel):
     duplicates: list[DuplicateReport] = Field(default_factory=list)
     improvements: list[ImprovementSuggestion] = Field(default_factory=list)
     
-    # Summary statistics
-    conflict_count: int = Field(default=0)
-    duplicate_count: int = Field(default=0)
-    improvement_count: int = Field(default=0)
+    # Summary statistics, derived from the lists above. They are included in
+    # serialized output; stored values in older saved analyses are ignored.
+    
+    @computed_field
+    @property
+    def conflict_count(self) -> int:
+        return len(self.conflicts)
+    
+    @computed_field
+    @property
+    def duplicate_count(self) -> int:
+        return len(self.duplicates)
+    
+    @computed_field
+    @property
+    def improvement_count(self) -> int:
+        return len(self.improvements)
+    
+    @computed_field
+    @property
+    def critical_issues(self) -> int:
+        return self._severity_counts[SeverityLevel.CRITICAL]
+    
+    @computed_field
+    @property
+    def high_issues(self) -> int:
+        return self._severity_counts[SeverityLevel.HIGH]
+    
+    @computed_field
+    @property
+    def medium_issues(self) -> int:
+        return self._severity_counts[SeverityLevel.MEDIUM]
+    
+    @computed_field
+    @property
+    def low_issues(self) -> int:
+        return self._severity_counts[SeverityLevel.LOW]
+    
+    @cached_property
+    def _severity_counts(self) -> Counter:
+        """Conflicts and duplicates per severity, counted in a single pass."""
+        return Counter(
+            issue.severity for issues in (self.conflicts, self.duplicates) for issue in issues
+        )
+    
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> "AnalysisResult":
+        """Copy the result; values derived from the lists are recomputed if any field is updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in ("_severity_counts", "_content_digest"):
+                copied.__dict__.pop(name, None)
+        return copied
+    
+    def fingerprint(self) -> str:
+        """
+        Stable identifier of this analysis, used for export caching and ETags.
+        
+        A digest of the full serialized result (analysis timestamp included),
+        so results that differ in any exported value never share one.
+        """
+        return self._content_digest
     
-    critical_issues: int = Field(default=0)
-    high_issues: int = Field(default=0)
-    medium_issues: int = Field(default=0)
-    low_issues: int = Field(default=0)
+    @cached_property
+    def _content_digest(self) -> str:
+        """Digest of the serialized result, computed once as results are frozen."""
+        return hashlib.blake2b(
+            self.__pydantic_serializer__.to_json(self), digest_size=16
+        ).hexdigest()
 
 
 class UploadResponse(BaseModel):
@@ -4,7 +4,8 @@
 
 from typing import Optional, List
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Relationship, JSON
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Field, Relationship, JSON, Session
 from pydantic import BaseModel
 
 class GPOLink(BaseModel):
@@ -35,13 +36,25 @@ class StoredGPO(SQLModel, table=True):
 
     @property
     def links(self) -> List[GPOLink]:
-        """Deserialize links_data to Pydantic models."""
-        return [GPOLink(**link) for link in self.links_data]
+        """
+        Deserialize links_data to Pydantic models.
+        
+        The list is built once and cached on the instance for as long as
+        links_data is the same object; the dicts were produced by the setter,
+        so they are not validated again.
+        """
+        cached = self.__dict__.get("_links_cache")
+        if cached is not None and cached[0] is self.links_data:
+            return cached[1]
+        links = [GPOLink.model_construct(**link) for link in self.links_data]
+        self.__dict__["_links_cache"] = (self.links_data, links)
+        return links
 
     @links.setter
     def links(self, value: List[GPOLink]):
         """Serialize Pydantic models to dicts for storage."""
         self.links_data = [link.model_dump() for link in value]
+        self.__dict__.pop("_links_cache", None)
 
 
 class StoredSetting(SQLModel, table=True):
@@ -63,3 +76,18 @@ class StoredSetting(SQLModel, table=True):
 
     # Relationships
     gpo: StoredGPO = Relationship(back_populates="settings")
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: List[dict]) -> None:
+        """
+        Insert many settings in one executemany statement.
+        
+        Bypasses ORM instance construction and identity-map bookkeeping;
+        rows are plain dicts keyed by column name.
+        
+        Args:
+            session: Database session
+            rows: Column values for each setting
+        """
+        if rows:
+            session.execute(insert(cls), rows)
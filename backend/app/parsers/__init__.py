@@ -1,2 +1,2 @@
 # Parsers package
-from backend.app.parsers.gpo_parser import GPOParser, parse_gpo_files
+from backend.app.parsers.gpo_parser import GPOParser, detect_encoding, parse_gpo_files
@@ -2,13 +2,20 @@
 # GPO Parser - Supports HTML, HTM, XML formats from AD GPO exports
 # =============================================================================
 
+import codecs
+import io
 import re
 import uuid
 import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from bs4 import BeautifulSoup
+from typing import Iterator, Optional, Union
+from dateutil.parser import parse as parse_date
 from lxml import etree
 
 from backend.app.models.gpo import (
@@ -17,6 +24,235 @@ from backend.app.models.gpo import (
 
 logger = logging.getLogger(__name__)
 
+# Byte order marks and the codecs that decode (and drop) them. UTF-32 is
+# listed first because its little-endian BOM starts with the UTF-16 one.
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+)
+
+
+def detect_encoding(raw: bytes) -> str:
+    """
+    Detect the text encoding of an exported report.
+    
+    Get-GPOReport writes UTF-16 with a BOM; files without one are
+    treated as UTF-16LE if their first 100 bytes are mostly NULs.
+    
+    Args:
+        raw: File content, or at least its first 101 bytes
+        
+    Returns:
+        Codec name for bytes.decode()
+    """
+    encoding = next((enc for bom, enc in _BOMS if raw.startswith(bom)), None)
+    if encoding:
+        logger.debug(f"Detected {encoding} encoding (BOM)")
+        return encoding
+    
+    # No BOM, check if it looks like UTF-16 (many null bytes in ASCII range)
+    if len(raw) > 100 and raw.count(b'\x00', 0, 100) > 20:
+        logger.debug("Detected UTF-16LE encoding (heuristic)")
+        return 'utf-16-le'
+    return 'utf-8'
+
+
+# libxml2 names for the encodings detect_encoding() returns without a BOM.
+# BOM-prefixed input is left to libxml2, which detects the BOM itself.
+_LIBXML_ENCODINGS = {'utf-8': 'utf-8', 'utf-16-le': 'utf-16le'}
+
+
+def _replace_undecodable(raw: bytes, encoding: Optional[str]) -> Optional[bytes]:
+    """
+    UTF-8 copy of a report with undecodable bytes replaced.
+    
+    libxml2 does not reject bytes that are invalid in the declared
+    encoding, so reports are checked up front and repaired the way they
+    were when decoded with errors='replace'.
+    
+    Returns:
+        The repaired bytes, or None if raw already decodes cleanly
+    """
+    try:
+        raw.decode(encoding or 'utf-8')
+    except UnicodeDecodeError:
+        return raw.decode(encoding or 'utf-8', errors='replace').encode('utf-8')
+    return None
+
+
+def _class_test(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled XPath queries for the Get-GPOReport HTML layout
+_XP_TEXT = etree.XPath(".//text()[not(parent::script or parent::style)]", smart_strings=False)
+_XP_CONFIG_SECTIONS = etree.XPath(f"//div[{_class_test('he0_expanded')}]")
+_XP_SECTION_TITLE = etree.XPath(f"(.//span[{_class_test('sectionTitle')}])[1]")
+_XP_NEXT_CONTAINER = etree.XPath(f"following-sibling::div[{_class_test('container')}][1]")
+_XP_ITEMS = etree.XPath(f".//div[{_class_test('he4')}]")
+# Property tables of a registry item: the item's container, then the
+# container following its first "General" (he4h) heading
+_XP_REGISTRY_TABLES = etree.XPath(
+    f"following-sibling::div[{_class_test('container')}][1]"
+    f"/descendant::div[{_class_test('he4h')}][1]"
+    f"/following-sibling::div[{_class_test('container')}][1]//table"
+)
+_XP_NEXT_TD = etree.XPath("following-sibling::td[1]")
+# Elements whose text _XP_TEXT leaves out
+_NO_TEXT_TAGS = frozenset({'script', 'style'})
+
+
+def _text(element) -> str:
+    """Concatenated, stripped text of an element (like BeautifulSoup's get_text(strip=True))."""
+    if not len(element) and element.tag not in _NO_TEXT_TAGS:
+        # Most table cells hold a single text node; skip the XPath query
+        text = element.text
+        return text.strip() if text else ""
+    return "".join(t.strip() for t in _XP_TEXT(element))
+
+
+def _first(xpath: etree.XPath, element):
+    """First result of a compiled XPath query, or None."""
+    result = xpath(element)
+    return result[0] if result else None
+
+
+# Label fragments identifying GPO metadata rows in HTML reports
+_METADATA_PATTERNS = {
+    'domain': ('domain', 'domain name'),
+    'created': ('created', 'creation time', 'created time'),
+    'modified': ('modified', 'last modified', 'modified time'),
+    'owner': ('owner', 'gpo owner'),
+    'guid': ('unique id', 'guid', 'gpo guid', 'unique identifier'),
+}
+
+# Exact labels resolve directly; a pattern never contains another field's pattern
+_METADATA_LABELS = {
+    pattern: (field,) for field, patterns in _METADATA_PATTERNS.items() for pattern in patterns
+}
+_METADATA_FIELD = {pattern: fields[0] for pattern, fields in _METADATA_LABELS.items()}
+
+# All patterns as one alternation, longest first. The lookahead reports a
+# match at every position, so overlapping patterns are all found.
+_METADATA_RE = re.compile(
+    '(?=(' + '|'.join(sorted(map(re.escape, _METADATA_LABELS), key=len, reverse=True)) + '))'
+)
+
+
+@lru_cache(maxsize=4096)
+def _metadata_fields(label: str) -> tuple[str, ...]:
+    """Metadata fields whose patterns occur in a lower-cased row label."""
+    fields = _METADATA_LABELS.get(label)
+    if fields is not None:
+        return fields
+    found = {_METADATA_FIELD[m] for m in _METADATA_RE.findall(label)}
+    return tuple(field for field in _METADATA_PATTERNS if field in found)
+
+
+# Keyword tables for state detection, keyed by lower-cased text
+_VALUE_STATES = {
+    'enabled': PolicyState.ENABLED,
+    'disabled': PolicyState.DISABLED,
+    'not configured': PolicyState.NOT_CONFIGURED,
+    'not defined': PolicyState.NOT_CONFIGURED,
+}
+_STATE_WORDS = {
+    **dict.fromkeys(('enabled', 'true', '1', 'yes', 'on'), PolicyState.ENABLED),
+    **dict.fromkeys(('disabled', 'false', '0', 'no', 'off'), PolicyState.DISABLED),
+}
+_ACTION_STATES = {
+    **dict.fromkeys(('update', 'create', 'replace'), PolicyState.ENABLED),
+    'delete': PolicyState.DISABLED,
+}
+_PURE_STATES = frozenset({'enabled', 'disabled', 'not configured'})
+_HEADER_WORDS = frozenset({'policy', 'setting', 'state', 'value'})
+_ENFORCED_WORDS = frozenset({'yes', 'true', 'enforced'})
+_LINK_ENABLED_WORDS = frozenset({'yes', 'true', 'enabled'})
+_HEADING_TAGS = frozenset({'h2', 'h3', 'h4'})
+_GENERIC_TITLES = frozenset({'group policy report', 'gpo report', 'policy report'})
+
+# Local names of the child elements read from an XML policy node
+_NAME_TAGS = frozenset({'Name', 'SettingName'})
+_STATE_TAGS = frozenset({'State', 'Enabled'})
+_VALUE_TAGS = frozenset({'Value', 'Data'})
+_REGISTRY_VALUE_TAGS = frozenset({'RegistryValue'})
+_KEY_PATH_TAGS = frozenset({'KeyPath'})
+_VALUE_NAME_TAGS = frozenset({'ValueName'})
+# Setting field of each recognised child tag; the first matching child wins
+_SETTING_CHILD_FIELDS = {
+    **dict.fromkeys(_NAME_TAGS, 'name'),
+    **dict.fromkeys(_STATE_TAGS, 'state'),
+    **dict.fromkeys(_VALUE_TAGS, 'value'),
+    **dict.fromkeys(_REGISTRY_VALUE_TAGS, 'registry'),
+}
+
+
+@lru_cache(maxsize=4096)
+def _local_name(tag) -> str:
+    """Tag name without its namespace ('' for comments and processing instructions)."""
+    if not isinstance(tag, str):
+        return ''
+    return tag.rpartition('}')[2]
+
+
+# Content sniffing for uploads without a usable name or content type
+_MARKUP_START_RE = re.compile(r'\s*<')
+_HTML_MARKER_RE = re.compile(r'<html|<!doctype html', re.IGNORECASE)
+
+# Compiled namespace-prefixed lookups for _find_element, keyed by
+# (path, namespace URI); shared by all parser instances
+_NS_XPATH_CACHE: dict[tuple[str, str], etree.XPath] = {}
+
+# Scope -> element names of its configuration block in XML reports
+_CONFIG_PATHS = (
+    ('Computer', ['Computer', 'ComputerConfiguration']),
+    ('User', ['User', 'UserConfiguration']),
+)
+
+
+@lru_cache(maxsize=1024)
+def _is_category_class(class_attr: str) -> bool:
+    """Whether a div's class attribute marks a category or section header."""
+    lowered = class_attr.lower()
+    return 'category' in lowered or 'section' in lowered
+
+
+def _resolve_link_indices(headers: list[str]) -> tuple[int, int, int]:
+    """Column indices (-1 if absent) of location, enforced and enabled in a links table."""
+    loc_idx = -1
+    enforced_idx = -1
+    enabled_idx = -1
+    
+    for i, h in enumerate(headers):
+        if 'location' in h: loc_idx = i
+        elif 'enforced' in h: enforced_idx = i
+        elif 'link enabled' in h or 'enabled' in h: enabled_idx = i
+    
+    return loc_idx, enforced_idx, enabled_idx
+
+
+@lru_cache(maxsize=256)
+def _resolve_setting_columns(headers: tuple[str, ...]) -> tuple[int, int, int]:
+    """Column indices (-1 if absent) of policy, state and value in a settings table."""
+    policy_idx = -1
+    state_idx = -1
+    value_idx = -1
+    
+    for i, header in enumerate(headers):
+        header = header.lower() if header else ''
+        if 'policy' in header or 'name' in header:
+            policy_idx = i
+        elif 'state' in header or 'status' in header:
+            state_idx = i
+        elif 'setting' in header or 'value' in header or 'data' in header:
+            value_idx = i
+    
+    return policy_idx, state_idx, value_idx
+
 
 class GPOParser:
     """
@@ -44,83 +280,88 @@ class GPOParser:
             Tuple of (list of GPOInfo, list of PolicySetting)
         """
         suffix = file_path.suffix.lower()
-        
-        # Detect encoding by checking BOM or file signature
-        raw_bytes = file_path.read_bytes()
-        encoding = 'utf-8'
-        
-        # Check for BOM markers
-        if raw_bytes[:2] == b'\xff\xfe':
-            # UTF-16 LE BOM
-            encoding = 'utf-16-le'
-            logger.debug("Detected UTF-16LE encoding (BOM)")
-        elif raw_bytes[:2] == b'\xfe\xff':
-            # UTF-16 BE BOM
-            encoding = 'utf-16-be'
-            logger.debug("Detected UTF-16BE encoding (BOM)")
-        elif raw_bytes[:3] == b'\xef\xbb\xbf':
-            # UTF-8 BOM
-            encoding = 'utf-8'
-            logger.debug("Detected UTF-8 encoding (BOM)")
+        if suffix in ('.html', '.htm'):
+            parse = self._parse_html
+        elif suffix == '.xml':
+            parse = self._parse_xml
         else:
-            # No BOM, try to detect from content
-            # Check if it looks like UTF-16 (many null bytes in ASCII range)
-            if len(raw_bytes) > 100:
-                null_count = raw_bytes[:100].count(b'\x00')
-                if null_count > 20:  # Likely UTF-16
-                    encoding = 'utf-16-le'
-                    logger.debug("Detected UTF-16LE encoding (heuristic)")
-        
-        try:
-            content = raw_bytes.decode(encoding)
-        except Exception as e:
-            logger.warning(f"Failed to decode with {encoding}, falling back to UTF-8 with error replacement: {e}")
-            content = raw_bytes.decode('utf-8', errors='replace')
+            # Checked before reading, so stray files (.pol, .log, ...) cost no I/O
+            logger.warning(f"Unsupported file format: {suffix}")
+            return [], []
         
-        if not content or len(content) < 100:
+        raw_bytes = file_path.read_bytes()
+        if len(raw_bytes) < 100:
             logger.error(f"Failed to read file {file_path} properly")
             return [], []
         
-        if suffix in ['.html', '.htm']:
-            return self._parse_html(content, str(file_path))
-        elif suffix == '.xml':
-            return self._parse_xml(content, str(file_path))
-        else:
-            logger.warning(f"Unsupported file format: {suffix}")
-            return [], []
+        # Detect encoding by checking BOM or file signature; lxml decodes
+        # the bytes itself, so the report is never copied into a str
+        encoding = detect_encoding(raw_bytes)
+        return parse(raw_bytes, str(file_path), encoding)
     
-    def parse_content(self, content: str, filename: str, content_type: str) -> tuple[list[GPOInfo], list[PolicySetting]]:
+    def parse_content(
+        self, content: Union[str, bytes], filename: str, content_type: str
+    ) -> tuple[list[GPOInfo], list[PolicySetting]]:
         """
         Parse GPO content from uploaded data.
         
         Args:
-            content: File content as string
+            content: File content as string, or the raw uploaded bytes
+                (decoded by lxml using the detected encoding)
             filename: Original filename
             content_type: MIME type or extension hint
             
         Returns:
             Tuple of (list of GPOInfo, list of PolicySetting)
         """
+        encoding = detect_encoding(content) if isinstance(content, bytes) else None
+        
         if 'html' in content_type.lower() or filename.lower().endswith(('.html', '.htm')):
-            return self._parse_html(content, filename)
+            return self._parse_html(content, filename, encoding)
         elif 'xml' in content_type.lower() or filename.lower().endswith('.xml'):
-            return self._parse_xml(content, filename)
+            return self._parse_xml(content, filename, encoding)
         else:
-            # Try to detect format from content
-            if content.strip().startswith('<?xml') or content.strip().startswith('<'):
-                if '<html' in content.lower() or '<!doctype html' in content.lower():
+            if isinstance(content, bytes):
+                content = content.decode(encoding, errors='replace')
+            # Try to detect format from content (matched in place, the
+            # document is never copied)
+            if _MARKUP_START_RE.match(content):
+                if _HTML_MARKER_RE.search(content):
                     return self._parse_html(content, filename)
                 return self._parse_xml(content, filename)
             return [], []
     
-    def _parse_html(self, content: str, source_file: str) -> tuple[list[GPOInfo], list[PolicySetting]]:
-        """Parse HTML/HTM format GPO report."""
-        soup = BeautifulSoup(content, 'html5lib')
+    def _parse_html(
+        self, content: Union[str, bytes], source_file: str, encoding: Optional[str] = None
+    ) -> tuple[list[GPOInfo], list[PolicySetting]]:
+        """Parse HTML/HTM format GPO report (raw bytes are decoded as `encoding`)."""
+        if isinstance(content, str):
+            # lxml refuses str input that carries an encoding declaration
+            content, encoding = content.encode('utf-8'), 'utf-8'
+        else:
+            repaired = _replace_undecodable(content, encoding)
+            if repaired is not None:
+                logger.warning(f"'{source_file}' is not valid {encoding}; replacing undecodable bytes")
+                content, encoding = repaired, 'utf-8'
+        try:
+            # Plain etree parser: lxml.html's parser resolves a Python
+            # element class for every node the extractors touch
+            parser = etree.HTMLParser(encoding=_LIBXML_ENCODINGS.get(encoding))
+            root = etree.fromstring(content, parser)
+            if root is None:
+                raise etree.ParserError("Document is empty")
+        except (etree.LxmlError, ValueError) as e:
+            # Documents lxml builds no tree for; let html5lib try instead
+            logger.warning(f"lxml could not parse '{source_file}', falling back to html5lib: {e}")
+            content = content.decode(encoding or 'utf-8', errors='replace')
+            root = self._parse_html_fallback(content, source_file)
+            if root is None:
+                return [], []
         gpos = []
         settings = []
         
         # Try to extract GPO name from title or header
-        gpo_name = self._extract_gpo_name_html(soup, source_file)
+        gpo_name = self._extract_gpo_name_html(root, source_file)
         gpo_id = str(uuid.uuid4())
         
         # Look for GPO metadata table
@@ -131,144 +372,145 @@ class GPOParser:
         )
         
         # Extract metadata from various HTML structures
-        self._extract_metadata_html(soup, gpo_info)
+        self._extract_metadata_html(root, gpo_info)
         # Update ID in case it was found in metadata
         gpo_id = gpo_info.id
         
         gpos.append(gpo_info)
         
         # Extract policy settings from tables
-        settings.extend(self._extract_settings_html(soup, gpo_id, gpo_name))
+        settings.extend(self._extract_settings_html(root, gpo_id, gpo_name))
         
         logger.info(f"Parsed HTML file '{source_file}': {len(gpos)} GPO(s), {len(settings)} setting(s)")
         return gpos, settings
     
-    def _extract_gpo_name_html(self, soup: BeautifulSoup, source_file: str) -> str:
+    def _parse_html_fallback(self, content: str, source_file: str):
+        """Build a tree with html5lib, which is optional (beautifulsoup4 + html5lib)."""
+        try:
+            from bs4 import FeatureNotFound
+            from lxml.html import soupparser
+        except ImportError:
+            soupparser = None
+        
+        if soupparser is not None:
+            try:
+                return soupparser.fromstring(content, features='html5lib')
+            except FeatureNotFound:
+                pass  # bs4 is installed but html5lib is not
+        
+        logger.error(f"Cannot parse '{source_file}': the html5lib fallback is not installed")
+        return None
+    
+    def _extract_gpo_name_html(self, root: etree._Element, source_file: str) -> str:
         """Extract GPO name from HTML content."""
         # Try title tag
-        title = soup.find('title')
-        if title and title.string:
-            title_text = title.string.strip()
+        title = root.find('.//title')
+        if title is not None and title.text:
+            title_text = title.text.strip()
             # Common patterns: "Group Policy Report - GPO Name" or just "GPO Name"
             if ' - ' in title_text:
                 return title_text.split(' - ')[-1].strip()
             return title_text
         
         # Try h1 or h2 headers
-        for header in soup.find_all(['h1', 'h2', 'h3']):
-            text = header.get_text(strip=True)
+        for header in root.iter('h1', 'h2', 'h3'):
+            text = _text(header)
             if text and 'gpo' not in text.lower() or len(text) > 3:
                 # Skip generic headers like "GPO Report"
-                if text.lower() not in ['group policy report', 'gpo report', 'policy report']:
+                if text.lower() not in _GENERIC_TITLES:
                     return text
         
         # Try to find name in specific table cells
-        for td in soup.find_all('td'):
-            if td.get_text(strip=True).lower() == 'name:':
-                next_td = td.find_next_sibling('td')
-                if next_td:
-                    return next_td.get_text(strip=True)
+        for td in root.iter('td'):
+            if _text(td).lower() == 'name:':
+                next_td = _first(_XP_NEXT_TD, td)
+                if next_td is not None:
+                    return _text(next_td)
         
         # Fallback to filename
         return Path(source_file).stem
     
-    def _extract_metadata_html(self, soup: BeautifulSoup, gpo_info: GPOInfo) -> None:
+    def _extract_metadata_html(self, root: etree._Element, gpo_info: GPOInfo) -> None:
         """Extract GPO metadata from HTML tables."""
-        # Look for metadata patterns in tables
-        metadata_patterns = {
-            'domain': ['domain', 'domain name'],
-            'created': ['created', 'creation time', 'created time'],
-            'modified': ['modified', 'last modified', 'modified time'],
-            'owner': ['owner', 'gpo owner'],
-            'guid': ['unique id', 'guid', 'gpo guid', 'unique identifier']
-        }
-        
-        for row in soup.find_all('tr'):
-            cells = row.find_all(['td', 'th'])
+        for row in root.iter('tr'):
+            # Only the first two cells matter; rows holding nested tables
+            # would otherwise materialize every cell below them
+            cells = list(islice(row.iter('td', 'th'), 2))
             if len(cells) >= 2:
-                label = cells[0].get_text(strip=True).lower().rstrip(':')
-                value = cells[1].get_text(strip=True)
+                label = _text(cells[0]).lower().rstrip(':')
+                fields = _metadata_fields(label)
+                if not fields:
+                    continue
+                value = _text(cells[1])
                 
-                for field, patterns in metadata_patterns.items():
-                    if any(p in label for p in patterns):
-                        if field == 'domain':
-                            gpo_info.domain = value
-                        elif field == 'created':
-                            gpo_info.created = self._parse_datetime(value)
-                        elif field == 'modified':
-                            gpo_info.modified = self._parse_datetime(value)
-                        elif field == 'owner':
-                            gpo_info.owner = value
-                        elif field == 'guid' and value:
-                            gpo_info.id = value
+                for field in fields:
+                    if field == 'domain':
+                        gpo_info.domain = value
+                    elif field == 'created':
+                        gpo_info.created = self._parse_datetime(value)
+                    elif field == 'modified':
+                        gpo_info.modified = self._parse_datetime(value)
+                    elif field == 'owner':
+                        gpo_info.owner = value
+                    elif field == 'guid' and value:
+                        gpo_info.id = value
         
         # Extract links (Links to Site, Domain, OU)
-        self._extract_links_html(soup, gpo_info)
+        self._extract_links_html(root, gpo_info)
 
-    def _extract_links_html(self, soup: BeautifulSoup, gpo_info: GPOInfo) -> None:
+    def _extract_links_html(self, root: etree._Element, gpo_info: GPOInfo) -> None:
         """Extract GPO links (SOMs) from HTML tables."""
         # Find the "Links" section or table
         # Structure varies, but often under a "Links" header or div
         
         # Method 1: Look for table with headers "Location", "Enforced", "Link Enabled"
-        for table in soup.find_all('table'):
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+        for table in root.iter('table'):
+            headers = [_text(th).lower() for th in table.iter('th')]
             if 'location' in headers and ('enforced' in headers or 'link enabled' in headers):
                 # This is likely the links table
-                rows = table.find_all('tr')[1:] # Skip header
+                # Map headers to indices once per table
+                loc_idx, enforced_idx, enabled_idx = _resolve_link_indices(headers)
+                
+                rows = list(table.iter('tr'))[1:] # Skip header
                 for row in rows:
-                    cells = row.find_all('td')
+                    cells = list(row.iter('td'))
                     if len(cells) >= 3:
-                        # Map headers to indices
-                        loc_idx = -1
-                        enforced_idx = -1
-                        enabled_idx = -1
+                        location = _text(cells[loc_idx])
+                        enforced = False
+                        enabled = True
                         
-                        for i, h in enumerate(headers):
-                            if 'location' in h: loc_idx = i
-                            elif 'enforced' in h: enforced_idx = i
-                            elif 'link enabled' in h or 'enabled' in h: enabled_idx = i
-                        
-                        if loc_idx != -1:
-                            location = cells[loc_idx].get_text(strip=True)
-                            enforced = False
-                            enabled = True
-                            
-                            if enforced_idx != -1:
-                                enforced_text = cells[enforced_idx].get_text(strip=True).lower()
-                                enforced = enforced_text in ['yes', 'true', 'enforced']
-                                
-                            if enabled_idx != -1:
-                                enabled_text = cells[enabled_idx].get_text(strip=True).lower()
-                                enabled = enabled_text in ['yes', 'true', 'enabled']
+                        if enforced_idx != -1:
+                            enforced_text = _text(cells[enforced_idx]).lower()
+                            enforced = enforced_text in _ENFORCED_WORDS
                             
-                            if location:
-                                gpo_info.links.append(GPOLink(
-                                    location=location,
-                                    enforced=enforced,
-                                    enabled=enabled
-                                ))
-    
-    def _extract_settings_html(self, soup: BeautifulSoup, gpo_id: str, gpo_name: str) -> list[PolicySetting]:
-        """Extract policy settings from HTML tables and div-based structures."""
-        settings = []
-        
+                        if enabled_idx != -1:
+                            enabled_text = _text(cells[enabled_idx]).lower()
+                            enabled = enabled_text in _LINK_ENABLED_WORDS
+                        
+                        if location:
+                            gpo_info.links.append(GPOLink(
+                                location=location,
+                                enforced=enforced,
+                                enabled=enabled
+                            ))
+    
+    def _extract_settings_html(self, root: etree._Element, gpo_id: str, gpo_name: str) -> Iterator[PolicySetting]:
+        """Yield policy settings from HTML tables and div-based structures."""
         # First, try to parse Get-GPOReport div-based structure
-        div_settings = self._extract_settings_from_divs(soup, gpo_id, gpo_name)
-        if div_settings:
-            logger.info(f"Found {len(div_settings)} settings using div-based parsing")
-            settings.extend(div_settings)
+        div_count = 0
+        for setting in self._extract_settings_from_divs(root, gpo_id, gpo_name):
+            div_count += 1
+            yield setting
         
-        # If no div-based settings found, fall back to table-based parsing
-        if not div_settings:
+        if div_count:
+            logger.info(f"Found {div_count} settings using div-based parsing")
+        else:
+            # If no div-based settings found, fall back to table-based parsing
             logger.info("No div-based settings found, trying table-based parsing")
-            table_settings = self._extract_settings_from_tables(soup, gpo_id, gpo_name)
-            settings.extend(table_settings)
-        
-        return settings
+            yield from self._extract_settings_from_tables(root, gpo_id, gpo_name)
     
-    def _extract_settings_from_divs(self, soup: BeautifulSoup, gpo_id: str, gpo_name: str) -> list[PolicySetting]:
-        """Extract settings from Get-GPOReport HTML div-based structure.
+    def _extract_settings_from_divs(self, root: etree._Element, gpo_id: str, gpo_name: str) -> Iterator[PolicySetting]:
+        """Yield settings from Get-GPOReport HTML div-based structure.
         
         Handles the structure:
         User/Computer Configuration (Enabled)
@@ -278,16 +520,15 @@ class GPOParser:
                    -> Collection: ...
                       -> Registry item: <name>
         """
-        settings = []
         current_scope = "Computer"
         
         # Find Computer and User Configuration sections
-        for config_div in soup.find_all('div', class_='he0_expanded'):
-            span = config_div.find('span', class_='sectionTitle')
-            if not span:
+        for config_div in _XP_CONFIG_SECTIONS(root):
+            span = _first(_XP_SECTION_TITLE, config_div)
+            if span is None:
                 continue
                 
-            config_text = span.get_text(strip=True)
+            config_text = _text(span)
             
             # Determine scope from section title
             if 'computer configuration' in config_text.lower():
@@ -301,49 +542,47 @@ class GPOParser:
             
             # Find all Registry item divs within this configuration
             # Look for divs with class he4 (registry items are at this level)
-            container = config_div.find_next_sibling('div', class_='container')
-            if not container:
+            container = _first(_XP_NEXT_CONTAINER, config_div)
+            if container is None:
                 continue
             
             # Build category path by traversing the hierarchy
-            registry_items = container.find_all('div', class_='he4')
+            registry_items = _XP_ITEMS(container)
             
             for item_div in registry_items:
-                item_span = item_div.find('span', class_='sectionTitle')
-                if not item_span:
+                item_span = _first(_XP_SECTION_TITLE, item_div)
+                if item_span is None:
                     continue
                 
-                item_title = item_span.get_text(strip=True)
+                item_title = _text(item_span)
                 
                 # Check if this is a registry item
                 if item_title.startswith('Registry item:'):
                     # Extract setting name from title
                     setting_name = item_title.replace('Registry item:', '').strip()
                     
-                    # Find the General section with the properties table
-                    item_container = item_div.find_next_sibling('div', class_='container')
-                    if not item_container:
+                    # Find the properties tables of the General section
+                    tables = _XP_REGISTRY_TABLES(item_div)
+                    if not tables:
                         continue
                     
                     # Extract registry details from the properties table
                     setting = self._parse_registry_item(
-                        item_container, setting_name, gpo_id, gpo_name, current_scope
+                        tables, setting_name, gpo_id, gpo_name, current_scope
                     )
                     
                     if setting:
-                        settings.append(setting)
-        
-        return settings
+                        yield setting
     
     def _parse_registry_item(
         self, 
-        container, 
+        tables: list, 
         setting_name: str, 
         gpo_id: str, 
         gpo_name: str, 
         scope: str
     ) -> Optional[PolicySetting]:
-        """Parse a registry item from Get-GPOReport HTML structure.
+        """Parse a registry item from its General section property tables.
         
         Extracts:
         - Action (Update/Create/Delete/Replace) -> determines state
@@ -352,54 +591,23 @@ class GPOParser:
         - Value type
         - Value data
         """
-        # Find the General section
-        general_div = container.find('div', class_='he4h')
-        if not general_div:
-            return None
-        
-        general_container = general_div.find_next_sibling('div', class_='container')
-        if not general_container:
-            return None
-        
-        # Find the properties table
-        tables = general_container.find_all('table')
-        if not tables:
-            return None
-        
-        # Extract data from table rows
-        action = None
-        key_path = None
-        value_name = None
-        value_type = None
-        value_data = None
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True).lower()
-                    value = cells[1].get_text(strip=True)
-                    
-                    if label == 'action':
-                        action = value
-                    elif label == 'key path':
-                        key_path = value
-                    elif label == 'value name':
-                        value_name = value
-                    elif label == 'value type':
-                        value_type = value
-                    elif label == 'value data':
-                        value_data = value
+        # Label -> value for every two-column row; later rows win
+        properties = {
+            _text(cells[0]).lower(): _text(cells[1])
+            for table in tables
+            for row in table.iter('tr')
+            if len(cells := list(row.iter('td'))) >= 2
+        }
+        action = properties.get('action')
+        key_path = properties.get('key path')
+        value_name = properties.get('value name')
+        value_type = properties.get('value type')
+        value_data = properties.get('value data')
         
         # Determine state from action
         state = PolicyState.NOT_CONFIGURED
         if action:
-            action_lower = action.lower()
-            if action_lower in ['update', 'create', 'replace']:
-                state = PolicyState.ENABLED
-            elif action_lower == 'delete':
-                state = PolicyState.DISABLED
+            state = _ACTION_STATES.get(action.lower(), PolicyState.NOT_CONFIGURED)
         
         # Build category from key path
         category = "Registry"
@@ -431,77 +639,75 @@ class GPOParser:
             scope=scope
         )
     
-    def _extract_settings_from_tables(self, soup: BeautifulSoup, gpo_id: str, gpo_name: str) -> list[PolicySetting]:
-        """Extract policy settings from HTML tables (legacy parsing method)."""
-        settings = []
+    def _extract_settings_from_tables(self, root: etree._Element, gpo_id: str, gpo_name: str) -> Iterator[PolicySetting]:
+        """Yield policy settings from HTML tables (legacy parsing method)."""
         current_category = "General"
         current_scope = "Computer"
         
         # Track section headers for category
-        for element in soup.find_all(['h2', 'h3', 'h4', 'table', 'div']):
-            if element.name in ['h2', 'h3', 'h4']:
-                header_text = element.get_text(strip=True)
+        for element in root.iter('h2', 'h3', 'h4', 'table', 'div'):
+            if element.tag in _HEADING_TAGS:
+                header_text = _text(element)
+                header_lower = header_text.lower()
                 # Detect scope from headers
-                if 'computer' in header_text.lower():
+                if 'computer' in header_lower:
                     current_scope = "Computer"
-                elif 'user' in header_text.lower():
+                elif 'user' in header_lower:
                     current_scope = "User"
                 # Update category from section headers
                 if header_text and len(header_text) < 100:
                     current_category = header_text
             
-            elif element.name == 'table':
+            elif element.tag == 'table':
                 # Parse table rows for settings
-                rows = element.find_all('tr')
-                headers = []
+                rows = element.iter('tr')
+                headers = ()
                 
                 for row in rows:
-                    header_cells = row.find_all('th')
-                    if header_cells:
-                        headers = [h.get_text(strip=True).lower() for h in header_cells]
+                    # Header and data cells are collected in one traversal
+                    cells = list(row.iter('th', 'td'))
+                    if any(c.tag == 'th' for c in cells):
+                        headers = tuple(_text(c).lower() for c in cells if c.tag == 'th')
                         continue
                     
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
+                    # Text of each cell, extracted once per row
+                    cell_texts = [_text(c) for c in cells]
+                    if len(cell_texts) >= 2:
                         setting = self._parse_setting_row(
-                            cells, headers, gpo_id, gpo_name, 
+                            cell_texts, headers, gpo_id, gpo_name, 
                             current_category, current_scope
                         )
                         if setting:
-                            settings.append(setting)
+                            yield setting
             
-            elif element.name == 'div':
+            elif element.tag == 'div':
                 # Check for category indicators in divs
-                class_names = ' '.join(element.get('class', []))
-                if 'category' in class_names.lower() or 'section' in class_names.lower():
-                    div_text = element.get_text(strip=True)[:100]
+                class_attr = element.get('class')
+                if class_attr and _is_category_class(class_attr):
+                    div_text = _text(element)[:100]
                     if div_text:
                         current_category = div_text
-        
-        return settings
     
     def _parse_setting_row(
         self, 
-        cells: list, 
-        headers: list, 
+        cell_texts: list[str], 
+        headers: tuple[str, ...], 
         gpo_id: str, 
         gpo_name: str,
         category: str, 
         scope: str
     ) -> Optional[PolicySetting]:
-        """Parse a table row as a policy setting.
+        """Parse a table row, given as the text of its cells, as a policy setting.
         
         Handles multiple Microsoft GPO HTML formats:
         1. Policy | State | Setting (3 columns)
         2. Policy | Setting (2 columns, state extracted from value)
         """
-        if len(cells) < 2:
+        if len(cell_texts) < 2:
             return None
         
-        cell_texts = [c.get_text(strip=True) for c in cells]
-        
         # Skip empty or header-like rows
-        if not any(cell_texts) or all(t.lower() in ['policy', 'setting', 'state', 'value'] for t in cell_texts if t):
+        if not any(cell_texts) or all(t.lower() in _HEADER_WORDS for t in cell_texts if t):
             return None
         
         # Determine columns based on headers or position
@@ -509,22 +715,9 @@ class GPOParser:
         state = PolicyState.NOT_CONFIGURED
         value = None
         
-        # Normalize headers for comparison
-        headers_lower = [h.lower() if h else '' for h in headers]
-        
         if headers:
-            # Find column indices by header name
-            policy_idx = -1
-            state_idx = -1
-            value_idx = -1
-            
-            for i, header in enumerate(headers_lower):
-                if 'policy' in header or 'name' in header:
-                    policy_idx = i
-                elif 'state' in header or 'status' in header:
-                    state_idx = i
-                elif 'setting' in header or 'value' in header or 'data' in header:
-                    value_idx = i
+            # Find column indices by header name (resolved once per header row)
+            policy_idx, state_idx, value_idx = _resolve_setting_columns(headers)
             
             # Extract values based on found indices
             if policy_idx >= 0 and policy_idx < len(cell_texts):
@@ -552,7 +745,7 @@ class GPOParser:
             if len(cell_texts) > 1:
                 # Check if second column looks like a pure state
                 second_col = cell_texts[1].lower().strip()
-                if second_col in ['enabled', 'disabled', 'not configured']:
+                if second_col in _PURE_STATES:
                     state = self._parse_state(cell_texts[1])
                     if len(cell_texts) > 2 and cell_texts[2]:
                         value = cell_texts[2]
@@ -591,12 +784,9 @@ class GPOParser:
         text_lower = value_text.lower().strip()
         
         # Pure state values
-        if text_lower == 'enabled':
-            return PolicyState.ENABLED, None
-        elif text_lower == 'disabled':
-            return PolicyState.DISABLED, None
-        elif text_lower in ['not configured', 'not defined']:
-            return PolicyState.NOT_CONFIGURED, None
+        state = _VALUE_STATES.get(text_lower)
+        if state is not None:
+            return state, None
         
         # Value text that implies enabled state (contains a configured value)
         # Examples: "8 characters", "90 days", "24 passwords remembered"
@@ -606,48 +796,86 @@ class GPOParser:
         
         return PolicyState.NOT_CONFIGURED, None
     
-    def _parse_xml(self, content: str, source_file: str) -> tuple[list[GPOInfo], list[PolicySetting]]:
-        """Parse XML format GPO report (Get-GPOReport -ReportType XML or gpresult /X)."""
+    def _parse_xml(
+        self, content: Union[str, bytes], source_file: str, encoding: Optional[str] = None
+    ) -> tuple[list[GPOInfo], list[PolicySetting]]:
+        """Parse XML format GPO report (Get-GPOReport -ReportType XML or gpresult /X).
+        
+        The report is stream-parsed: each GPO element is handled as soon as
+        it is complete and then freed, so multi-GPO reports never hold the
+        whole tree in memory.
+        """
         gpos = []
         settings = []
         
         try:
             # Parse XML with lxml for namespace support
-            root = etree.fromstring(content.encode('utf-8'))
-            
-            # Handle different XML namespaces
-            nsmap = root.nsmap.copy()
-            ns_default = nsmap.get(None, '')
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+                encoding = 'utf-8'
+            # huge_tree lifts libxml2's size limits for very large reports;
+            # reports are never looked up by xml:id, so skip indexing IDs
+            context = etree.iterparse(
+                io.BytesIO(content), events=('end',), tag='{*}GPO',
+                encoding=_LIBXML_ENCODINGS.get(encoding),
+                huge_tree=True, collect_ids=False
+            )
             
-            # Create namespace prefix for xpath
-            ns = {'gp': ns_default} if ns_default else {}
+            ns = None
+            # GPO elements in the document's default namespace, and plain
+            # <GPO> elements below the root (used only if there are none of the former)
+            qualified = []
+            unqualified = []
             
-            # Try to find GPO elements
-            gpo_elements = root.xpath('//gp:GPO', namespaces=ns) if ns else root.findall('.//GPO')
-            
-            if not gpo_elements:
-                # Try without namespace
-                gpo_elements = root.findall('.//GPO')
+            for _, elem in context:
+                if ns is None:
+                    ns = self._default_namespace(elem.getroottree().getroot())
+                
+                if ns and elem.tag == f"{{{ns['gp']}}}GPO":
+                    qualified.append(self._parse_gpo_element_xml(elem, ns, source_file))
+                elif elem.tag == 'GPO' and elem.getparent() is not None:
+                    unqualified.append(self._parse_gpo_element_xml(elem, ns, source_file))
+                else:
+                    continue
+                
+                # Free the finished GPO along with any earlier siblings
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
             
-            if not gpo_elements:
+            results = qualified or unqualified
+            if not results:
                 # Single GPO report format
-                gpo_info, gpo_settings = self._parse_single_gpo_xml(root, ns, source_file)
+                root = context.root
+                if ns is None:
+                    ns = self._default_namespace(root)
+                results = [self._parse_single_gpo_xml(root, ns, source_file)]
+            
+            for gpo_info, gpo_settings in results:
                 if gpo_info:
                     gpos.append(gpo_info)
                     settings.extend(gpo_settings)
-            else:
-                for gpo_elem in gpo_elements:
-                    gpo_info, gpo_settings = self._parse_gpo_element_xml(gpo_elem, ns, source_file)
-                    if gpo_info:
-                        gpos.append(gpo_info)
-                        settings.extend(gpo_settings)
             
         except etree.XMLSyntaxError as e:
+            # Invalid bytes in the report's encoding are a syntax error to
+            # libxml2; retry once with them replaced
+            repaired = _replace_undecodable(content, encoding)
+            if repaired is not None:
+                logger.warning(f"'{source_file}' is not valid {encoding}; replacing undecodable bytes")
+                return self._parse_xml(repaired, source_file, 'utf-8')
             logger.error(f"XML parsing error in '{source_file}': {e}")
         
         logger.info(f"Parsed XML file '{source_file}': {len(gpos)} GPO(s), {len(settings)} setting(s)")
         return gpos, settings
     
+    def _default_namespace(self, root) -> dict:
+        """XPath namespace mapping ('gp' prefix) for the document's default namespace."""
+        # Handle different XML namespaces
+        ns_default = root.nsmap.get(None, '')
+        
+        # Create namespace prefix for xpath
+        return {'gp': ns_default} if ns_default else {}
+    
     def _parse_single_gpo_xml(self, root, ns: dict, source_file: str) -> tuple[Optional[GPOInfo], list[PolicySetting]]:
         """Parse a single GPO from XML root."""
         # Extract GPO name
@@ -678,7 +906,8 @@ class GPOParser:
             gpo_info.modified = self._parse_datetime(modified_elem.text)
         
         # Extract settings
-        settings = self._extract_settings_xml(root, ns, gpo_id, gpo_name)
+        # Settings are collected before the caller frees the element
+        settings = list(self._extract_settings_xml(root, ns, gpo_id, gpo_name))
         
         return gpo_info, settings
     
@@ -692,9 +921,13 @@ class GPOParser:
             # 1. Try strict namespace if provided
             if ns:
                 try:
-                    # Add namespace prefix to each path component
-                    ns_path = '/'.join(f"gp:{p}" for p in path.split('/'))
-                    result = parent.xpath(ns_path, namespaces=ns)
+                    key = (path, ns['gp'])
+                    xpath = _NS_XPATH_CACHE.get(key)
+                    if xpath is None:
+                        # Add namespace prefix to each path component
+                        ns_path = '/'.join(f"gp:{p}" for p in path.split('/'))
+                        xpath = _NS_XPATH_CACHE[key] = etree.XPath(ns_path, namespaces=ns)
+                    result = xpath(parent)
                     if result:
                         return result[0]
                 except Exception:
@@ -708,26 +941,25 @@ class GPOParser:
             # 3. Fallback: Try loose local-name matching for single-level paths
             # This handles cases where namespaces are messed up or unexpected
             if '/' not in path:
-                child = self._find_child_by_local_name(parent, [path])
+                child = self._find_child_by_local_name(parent, frozenset((path,)))
                 if child is not None:
                     return child
                     
         return None
     
-    def _extract_settings_xml(self, root, ns: dict, gpo_id: str, gpo_name: str) -> list[PolicySetting]:
-        """Extract policy settings from XML structure."""
-        settings = []
-        
+    def _extract_settings_xml(self, root, ns: dict, gpo_id: str, gpo_name: str) -> Iterator[PolicySetting]:
+        """Yield policy settings from XML structure."""
         # Look for Computer and User configurations
-        for config_type, scope in [('Computer', 'Computer'), ('User', 'User')]:
-            config_elem = self._find_element(root, [f'{config_type}', f'{config_type}Configuration'], ns)
+        for scope, paths in _CONFIG_PATHS:
+            config_elem = self._find_element(root, paths, ns)
             if config_elem is None:
                 continue
             
             # Recursively find all policy settings
-            settings.extend(self._extract_policy_nodes_xml(config_elem, gpo_id, gpo_name, scope, ""))
-        
-        return settings
+            yield from self._extract_policy_nodes_xml(config_elem, gpo_id, gpo_name, scope, "")
+            # Settings hold copies of the text, so release this scope's nodes
+            # before the next scope's settings are built
+            config_elem.clear(keep_tail=True)
     
     def _extract_policy_nodes_xml(
         self, 
@@ -736,25 +968,48 @@ class GPOParser:
         gpo_name: str, 
         scope: str, 
         category_path: str
-    ) -> list[PolicySetting]:
-        """Recursively extract policy nodes from XML."""
-        settings = []
+    ) -> Iterator[PolicySetting]:
+        """Yield policy nodes from the XML subtree below `element`.
         
-        for child in element:
-            # Get local tag name (ignore namespace)
-            tag_name = self._get_local_tag(child.tag)
+        The subtree is walked once with start/end events; a stack holds the
+        category path of every open element instead of recursing per level.
+        """
+        # Category path of the element whose children are being visited
+        categories = [category_path]
+        walk = etree.iterwalk(element, events=('start', 'end'))
+        next(walk)  # start of `element` itself
+        
+        for event, child in walk:
+            if event == 'end':
+                categories.pop()
+                continue
             
-            # Build category path
-            current_category = f"{category_path}/{tag_name}" if category_path else tag_name
+            category_path = categories[-1]
+            if not len(child):
+                # Leaves (Name, State, Value, ...) have no Name child, so they
+                # are never settings and have no descendants to categorize
+                categories.append(category_path)
+                continue
+            
+            # Get local tag name (ignore namespace) and build category path;
+            # interned so settings under same-named containers share one string
+            tag_name = _local_name(child.tag)
+            categories.append(sys.intern(f"{category_path}/{tag_name}") if category_path else tag_name)
             
             # Check if this child ITSELF is a setting (has Name/SettingName property)
-            # We look for DIRECT children with these names to avoid finding nested settings
-            name_elem = self._find_child_by_local_name(child, ['Name', 'SettingName'])
+            # We look for DIRECT children with these names to avoid finding nested
+            # settings; one pass picks up the first child for each field
+            fields = {}
+            for sub in child:
+                field = _SETTING_CHILD_FIELDS.get(_local_name(sub.tag))
+                if field is not None:
+                    fields.setdefault(field, sub)
+            name_elem = fields.get('name')
             
             if name_elem is not None and name_elem.text:
                 # It's a setting!
-                state_elem = self._find_child_by_local_name(child, ['State', 'Enabled'])
-                value_elem = self._find_child_by_local_name(child, ['Value', 'Data'])
+                state_elem = fields.get('state')
+                value_elem = fields.get('value')
                 
                 state = PolicyState.NOT_CONFIGURED
                 if state_elem is not None and state_elem.text:
@@ -767,21 +1022,21 @@ class GPOParser:
                 reg_value = None
                 
                 # Check RegistryValue container
-                reg_elem = self._find_child_by_local_name(child, ['RegistryValue'])
+                reg_elem = fields.get('registry')
                 if reg_elem is not None:
                     # Registry info might be in attributes or children
                     reg_path = reg_elem.get('path')
                     reg_value = reg_elem.get('valueName')
                     
                     if not reg_path:
-                        kp = self._find_child_by_local_name(reg_elem, ['KeyPath'])
+                        kp = self._find_child_by_local_name(reg_elem, _KEY_PATH_TAGS)
                         if kp is not None: reg_path = kp.text
                         
                     if not reg_value:
-                        vn = self._find_child_by_local_name(reg_elem, ['ValueName'])
+                        vn = self._find_child_by_local_name(reg_elem, _VALUE_NAME_TAGS)
                         if vn is not None: reg_value = vn.text
                 
-                settings.append(PolicySetting(
+                yield PolicySetting(
                     gpo_id=gpo_id,
                     gpo_name=gpo_name,
                     category=category_path or "General", # Use parent path as category
@@ -791,74 +1046,132 @@ class GPOParser:
                     registry_path=reg_path,
                     registry_value=reg_value,
                     scope=scope
-                ))
+                )
             
-            # Recurse into children to find more settings
+            # The walk continues into this node's children either way
             # (A setting node might also contain other settings in some schemas, 
             # or it might be a container like 'ExtensionData' that isn't a setting itself)
-            settings.extend(self._extract_policy_nodes_xml(
-                child, gpo_id, gpo_name, scope, current_category
-            ))
-        
-        return settings
 
-    def _get_local_tag(self, tag: str) -> str:
-        """Strip namespace from tag."""
-        if '}' in tag:
-            return tag.split('}')[-1]
-        return tag
-
-    def _find_child_by_local_name(self, element, local_names: list[str]):
+    def _find_child_by_local_name(self, element, local_names: frozenset[str]):
         """Find a direct child with a matching local tag name (ignoring namespace)."""
         for child in element:
-            if self._get_local_tag(child.tag) in local_names:
+            if _local_name(child.tag) in local_names:
                 return child
         return None
     
     def _parse_state(self, state_str: str) -> PolicyState:
         """Parse a state string to PolicyState enum."""
-        state_lower = state_str.lower().strip()
-        if state_lower in ['enabled', 'true', '1', 'yes', 'on']:
-            return PolicyState.ENABLED
-        elif state_lower in ['disabled', 'false', '0', 'no', 'off']:
-            return PolicyState.DISABLED
-        return PolicyState.NOT_CONFIGURED
+        return _parse_state_text(state_str)
     
     def _parse_datetime(self, dt_str: str) -> Optional[datetime]:
         """Parse various datetime formats."""
-        formats = [
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d %H:%M:%S',
-            '%m/%d/%Y %H:%M:%S',
-            '%m/%d/%Y %I:%M:%S %p',
-            '%d/%m/%Y %H:%M:%S',
-            '%B %d, %Y %H:%M:%S',
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_str.strip(), fmt)
-            except ValueError:
-                continue
-        
-        # Try parsing with dateutil as fallback
+        return _parse_datetime_text(dt_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_state_text(state_str: str) -> PolicyState:
+    """Parse a state string; memoized since reports use a handful of spellings."""
+    return _STATE_WORDS.get(state_str.lower().strip(), PolicyState.NOT_CONFIGURED)
+
+
+# Timestamp formats seen in reports, tried in order after the ISO fast path
+# (which covers the first three for zero-padded values), as (required
+# separator, ends with AM/PM, format). Formats whose separator or AM/PM
+# suffix the text lacks are skipped; the others can still fail and fall
+# through, e.g. '15/01/2023 13:00:00' tries '%m/%d/%Y' before '%d/%m/%Y',
+# and non-padded '2023-1-5 10:00:00' ends up with dateutil.
+_DATETIME_FORMATS = (
+    ('-', False, '%Y-%m-%dT%H:%M:%S'),
+    ('-', False, '%Y-%m-%dT%H:%M:%SZ'),
+    ('-', False, '%Y-%m-%d %H:%M:%S'),
+    ('/', False, '%m/%d/%Y %H:%M:%S'),
+    ('/', True, '%m/%d/%Y %I:%M:%S %p'),
+    ('/', False, '%d/%m/%Y %H:%M:%S'),
+    (',', False, '%B %d, %Y %H:%M:%S'),
+)
+
+
+# ISO 8601 text always starts with a four-digit year
+_ISO_START_RE = re.compile(r'[0-9]{4}')
+_ISO_UTC_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z')
+_MERIDIEM_RE = re.compile(r'[ap]m\Z', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_text(dt_str: str) -> Optional[datetime]:
+    """Parse a report timestamp; memoized since reports repeat the same values."""
+    text = dt_str.strip()
+    
+    # ISO 8601 fast path. With a trailing 'Z' only the exact
+    # '%Y-%m-%dT%H:%M:%SZ' shape is taken, parsed naive as that format is;
+    # other 'Z' forms keep going through the formats and dateutil.
+    if not _ISO_START_RE.match(text):
+        iso_text = None
+    elif not text.endswith('Z'):
+        iso_text = text
+    elif _ISO_UTC_RE.fullmatch(text):
+        iso_text = text[:-1]
+    else:
+        iso_text = None
+    if iso_text is not None:
         try:
-            from dateutil.parser import parse
-            return parse(dt_str)
-        except Exception:
-            return None
+            return datetime.fromisoformat(iso_text)
+        except ValueError:
+            pass
+    
+    meridiem = _MERIDIEM_RE.search(text) is not None
+    for separator, has_meridiem, fmt in _DATETIME_FORMATS:
+        if separator not in text or has_meridiem != meridiem:
+            continue
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    
+    # Try parsing with dateutil as fallback
+    try:
+        return parse_date(dt_str)
+    except Exception:
+        return None
 
 
 # Convenience function for parsing multiple files
-def parse_gpo_files(file_paths: list[Path]) -> tuple[list[GPOInfo], list[PolicySetting]]:
-    """Parse multiple GPO export files."""
-    parser = GPOParser()
+def _parse_one(path: Path) -> tuple[list[GPOInfo], list[PolicySetting]]:
+    """Parse a single file with a fresh parser (process pool entry point)."""
+    return GPOParser().parse_file(path)
+
+
+def parse_gpo_files(
+    file_paths: list[Path], workers: Optional[int] = None
+) -> tuple[list[GPOInfo], list[PolicySetting]]:
+    """
+    Parse multiple GPO export files.
+    
+    Files are independent and parsing is CPU-bound, so several files are
+    parsed in a process pool. Results keep the order of file_paths.
+    
+    Args:
+        file_paths: Paths of the GPO export files
+        workers: Maximum number of worker processes (default: CPU count);
+            1 parses sequentially in this process
+        
+    Returns:
+        Tuple of (list of GPOInfo, list of PolicySetting)
+    """
     all_gpos = []
     all_settings = []
     
-    for path in file_paths:
-        gpos, settings = parser.parse_file(path)
+    if len(file_paths) <= 1 or workers == 1:
+        results = map(_parse_one, file_paths)
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        # A few chunks per worker: fewer round trips without leaving
+        # workers idle when there are only a handful of files
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_one, file_paths, chunksize=chunksize))
+    
+    for gpos, settings in results:
         all_gpos.extend(gpos)
         all_settings.extend(settings)
     
@@ -0,0 +1,52 @@
+# =============================================================================
+# GPO Analysis Tool - Static Frontend Serving
+# =============================================================================
+
+import os
+from typing import Optional
+
+from starlette.staticfiles import StaticFiles
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that resolves paths from a table built once at startup.
+
+    The bundled frontend does not change while the server runs, so every
+    file and directory under the static directory is resolved and stat'ed
+    once by preload(). Requests for known paths then skip the realpath
+    and stat calls; unknown paths fall back to the regular lookup.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.setdefault("check_dir", False)
+        super().__init__(**kwargs)
+        self._lookup_cache: dict[str, tuple[str, os.stat_result]] = {}
+
+    def preload(self) -> int:
+        """
+        Resolve every path under the static directories.
+
+        Returns:
+            Number of cached paths
+        """
+        cache = {}
+        for directory in self.all_directories:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                rel_dir = os.path.relpath(dirpath, directory)
+                for name in (None, *filenames):
+                    rel_path = rel_dir if name is None else os.path.normpath(os.path.join(rel_dir, name))
+                    if rel_path in cache:
+                        continue  # Earlier directories take precedence
+                    # Reuse the regular lookup so its traversal checks apply
+                    full_path, stat_result = super().lookup_path(rel_path)
+                    if stat_result is not None:
+                        cache[rel_path] = (full_path, stat_result)
+        self._lookup_cache = cache
+        return len(cache)
+
+    def lookup_path(self, path: str) -> tuple[str, Optional[os.stat_result]]:
+        cached = self._lookup_cache.get(os.path.normpath(path))
+        if cached is not None:
+            return cached
+        return super().lookup_path(path)
@@ -3,12 +3,15 @@
 # =============================================================================
 # File-based storage for saving and loading GPO analysis results
 
-import json
 import logging
+import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from backend.app.models.gpo import AnalysisResult
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,19 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).parent.parent.parent
 STORAGE_DIR = BASE_DIR / "data" / "analyses"
 
+# Each analysis has a small sidecar ("<name>.meta.json") holding its listing
+# summary, so listing saved analyses does not parse the full files
+META_SUFFIX = ".meta.json"
+
+# Last listing, keyed on the storage directory's mtime, which changes when
+# an analysis is added, replaced or removed. Saves and deletes also drop it,
+# as the timestamp granularity can hide changes made in quick succession.
+# Callers get copies, so they cannot change later listings.
+_listing_cache: Optional[tuple[int, tuple[dict, ...]]] = None
+
+# Characters not allowed in saved analysis filenames, mapped to underscores
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
 
 def ensure_storage_dir():
     """Ensure the storage directory exists."""
@@ -25,12 +41,60 @@ def ensure_storage_dir():
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a name to be safe for use as a filename."""
-    # Replace unsafe characters with underscores
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        name = name.replace(char, '_')
-    # Limit length
-    return name[:100].strip()
+    # Replace unsafe characters with underscores, then limit length
+    return name.translate(_UNSAFE_FILENAME_CHARS)[:100].strip()
+
+
+def _invalidate_listing() -> None:
+    """Drop the cached listing after this process changes the storage directory."""
+    global _listing_cache
+    _listing_cache = None
+
+
+def _meta_path(filepath: Path) -> Path:
+    """Sidecar file holding the listing summary of a saved analysis."""
+    return filepath.with_suffix(META_SUFFIX)
+
+
+def _summary(name: str, saved_at: str, analysis: dict) -> dict:
+    """Listing summary of a saved analysis."""
+    return {
+        "name": name,
+        "saved_at": saved_at,
+        "gpo_count": analysis.get("gpo_count", 0),
+        "setting_count": analysis.get("setting_count", 0),
+        "conflict_count": analysis.get("conflict_count", 0),
+        "duplicate_count": analysis.get("duplicate_count", 0),
+        "improvement_count": analysis.get("improvement_count", 0),
+    }
+
+
+def _write_summary(filepath: Path, summary: dict) -> None:
+    """Write the sidecar of a saved analysis; listings fall back to the full file without it."""
+    try:
+        _meta_path(filepath).write_bytes(orjson.dumps(summary))
+    except OSError as e:
+        logger.warning(f"Failed to write listing metadata for {filepath}: {e}")
+
+
+def _read_summary(filepath: Path) -> dict:
+    """Read the listing summary of a saved analysis, from its sidecar if possible."""
+    try:
+        with open(_meta_path(filepath), 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        pass  # Saved before sidecars existed, or the sidecar is damaged
+    
+    with open(filepath, 'rb') as f:
+        save_data = orjson.loads(f.read())
+    summary = _summary(
+        save_data.get("name", filepath.stem),
+        save_data.get("saved_at", ""),
+        save_data.get("analysis", {}),
+    )
+    # Recreate the sidecar so this file is only parsed in full once
+    _write_summary(filepath, summary)
+    return summary
 
 
 def save_analysis(analysis: AnalysisResult, name: str) -> dict:
@@ -48,7 +112,9 @@ def save_analysis(analysis: AnalysisResult, name: str) -> dict:
     
     # Create a safe filename
     safe_name = sanitize_filename(name)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # One clock read, so the filename and saved_at always agree
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
     filename = f"{safe_name}_{timestamp}.json"
     filepath = STORAGE_DIR / filename
     
@@ -58,13 +124,25 @@ def save_analysis(analysis: AnalysisResult, name: str) -> dict:
     # Add metadata
     save_data = {
         "name": name,
-        "saved_at": datetime.now().isoformat(),
+        "saved_at": now.isoformat(),
         "analysis": analysis_dict
     }
     
+    # Written next to the target, synced and renamed into place, so listings
+    # and loads never see a partially written analysis, even after a crash
+    tmp_path = filepath.with_name(filename + '.tmp')
+    
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2, default=str)
+        # Encoded natively in one piece and written with a single call
+        payload = orjson.dumps(save_data, option=orjson.OPT_INDENT_2, default=str)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        
+        _write_summary(filepath, _summary(name, save_data["saved_at"], analysis_dict))
+        _invalidate_listing()
         
         logger.info(f"Saved analysis '{name}' to {filepath}")
         
@@ -76,12 +154,45 @@ def save_analysis(analysis: AnalysisResult, name: str) -> dict:
         }
     except Exception as e:
         logger.error(f"Failed to save analysis: {e}")
+        tmp_path.unlink(missing_ok=True)
         return {
             "success": False,
             "error": str(e)
         }
 
 
+@lru_cache(maxsize=4)
+def _load_validated(filepath: str, mtime_ns: int) -> AnalysisResult:
+    """
+    Read and validate a saved analysis.
+    
+    Reopening an unchanged file reuses the validated result; the
+    modification time is part of the key, so a rewritten file is read
+    again. The result is shared, so only hand it out through _detached().
+    """
+    with open(filepath, 'rb') as f:
+        save_data = orjson.loads(f.read())
+    
+    analysis_dict = save_data.get("analysis", save_data)
+    return AnalysisResult.model_validate(analysis_dict)
+
+
+def _detached(analysis: AnalysisResult) -> AnalysisResult:
+    """
+    Copy of a cached analysis that callers can change without affecting it.
+    
+    The lists are copied and the (mutable) GPOs deep-copied; settings and
+    reports are frozen, so they are shared.
+    """
+    return analysis.model_copy(update={
+        "gpos": [gpo.model_copy(deep=True) for gpo in analysis.gpos],
+        "settings": list(analysis.settings),
+        "conflicts": list(analysis.conflicts),
+        "duplicates": list(analysis.duplicates),
+        "improvements": list(analysis.improvements),
+    })
+
+
 def load_analysis(filename: str) -> Optional[AnalysisResult]:
     """
     Load a saved analysis from a JSON file.
@@ -94,16 +205,13 @@ def load_analysis(filename: str) -> Optional[AnalysisResult]:
     """
     filepath = STORAGE_DIR / filename
     
-    if not filepath.exists():
+    # Sidecars are JSON too, but would validate as an empty analysis
+    if filename.endswith(META_SUFFIX) or not filepath.exists():
         logger.error(f"Analysis file not found: {filepath}")
         return None
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            save_data = json.load(f)
-        
-        analysis_dict = save_data.get("analysis", save_data)
-        analysis = AnalysisResult.model_validate(analysis_dict)
+        analysis = _detached(_load_validated(str(filepath), filepath.stat().st_mtime_ns))
         
         logger.info(f"Loaded analysis from {filepath}")
         return analysis
@@ -120,32 +228,34 @@ def list_saved_analyses() -> list[dict]:
     Returns:
         List of dictionaries with analysis metadata
     """
+    global _listing_cache
     ensure_storage_dir()
     
+    # Read before scanning, so a change made during the scan forces a rescan
+    dir_mtime = os.stat(STORAGE_DIR).st_mtime_ns
+    cached = _listing_cache
+    if cached is not None and cached[0] == dir_mtime:
+        return [dict(summary) for summary in cached[1]]
+    
     analyses = []
     
-    for filepath in sorted(STORAGE_DIR.glob("*.json"), reverse=True):
+    # One scandir pass; DirEntry carries the file type, so no extra stat calls
+    with os.scandir(STORAGE_DIR) as it:
+        all_entries = list(it)
+    names = {entry.name for entry in all_entries}
+    entries = [
+        entry for entry in all_entries
+        if entry.name.endswith('.json') and not entry.name.endswith(META_SUFFIX)
+        and entry.is_file()
+    ]
+    entries.sort(key=lambda entry: entry.name, reverse=True)
+    # Files saved before sidecars existed get one during the scan below
+    backfills = any(_meta_path(Path(entry.path)).name not in names for entry in entries)
+    
+    for entry in entries:
+        filepath = Path(entry.path)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
-            # Get metadata
-            name = save_data.get("name", filepath.stem)
-            saved_at = save_data.get("saved_at", "")
-            
-            # Get analysis summary
-            analysis = save_data.get("analysis", {})
-            
-            analyses.append({
-                "filename": filepath.name,
-                "name": name,
-                "saved_at": saved_at,
-                "gpo_count": analysis.get("gpo_count", 0),
-                "setting_count": analysis.get("setting_count", 0),
-                "conflict_count": analysis.get("conflict_count", 0),
-                "duplicate_count": analysis.get("duplicate_count", 0),
-                "improvement_count": analysis.get("improvement_count", 0),
-            })
+            analyses.append({"filename": filepath.name, **_read_summary(filepath)})
             
         except Exception as e:
             logger.warning(f"Failed to read {filepath}: {e}")
@@ -155,6 +265,11 @@ def list_saved_analyses() -> list[dict]:
                 "error": str(e)
             })
     
+    # Creating sidecars changes the directory mtime, so a listing that did
+    # cannot tell its own changes from others made during the scan. It is
+    # not cached; the next listing finds every sidecar and caches instead.
+    if not backfills:
+        _listing_cache = (dir_mtime, tuple(dict(summary) for summary in analyses))
     return analyses
 
 
@@ -170,7 +285,8 @@ def delete_saved_analysis(filename: str) -> dict:
     """
     filepath = STORAGE_DIR / filename
     
-    if not filepath.exists():
+    # Sidecars go with their analysis and are never deleted on their own
+    if filename.endswith(META_SUFFIX) or not filepath.exists():
         return {
             "success": False,
             "error": "File not found"
@@ -178,6 +294,9 @@ def delete_saved_analysis(filename: str) -> dict:
     
     try:
         filepath.unlink()
+        _meta_path(filepath).unlink(missing_ok=True)
+        _invalidate_listing()
+        _load_validated.cache_clear()  # Release the deleted analysis
         logger.info(f"Deleted saved analysis: {filepath}")
         return {
             "success": True,
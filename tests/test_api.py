@@ -0,0 +1,146 @@
+"""
+Tests for the API routes.
+
+Routes run against an in-memory database so the data/ database is left alone.
+"""
+
+import io
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from backend.app.main import app
+from backend.app.api import routes
+from backend.app.database import get_session
+from backend.app.exporters import csv_exporter
+from backend.app.exporters.csv_exporter import export_to_zip
+from backend.app.models.gpo import AnalysisResult, GPOInfo, PolicySetting
+
+SAMPLE_HTML = Path(__file__).parent / 'sample_gpo.htm'
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+    
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def analysis(monkeypatch):
+    """A small analysis installed as the current one."""
+    result = AnalysisResult(
+        analyzed_at=datetime(2024, 1, 2, 3, 4, 5),
+        gpo_count=1,
+        setting_count=1,
+        gpos=[GPOInfo(id="123", name="Test GPO", source_file="test.xml")],
+        settings=[PolicySetting(
+            gpo_id="123", gpo_name="Test GPO", category="Security",
+            name="Test Setting", value="Enabled"
+        )],
+    )
+    monkeypatch.setattr(routes, "_current_analysis", result)
+    csv_exporter._COMBINED_CACHE.clear()
+    csv_exporter._GZIP_CACHE.clear()
+    return result
+
+
+def test_upload_non_utf8_html(client):
+    """A cp1252 upload is parsed with replacement chars instead of erroring."""
+    content = SAMPLE_HTML.read_text(encoding='utf-8').replace(
+        'SEC-Baseline-Computer', 'SEC-Baseline-Sécurité'
+    ).encode('cp1252')
+    
+    response = client.post(
+        "/api/upload", files=[("files", ("cp1252.htm", content, "text/html"))]
+    )
+    
+    body = response.json()
+    assert body["success"], body
+    assert body["gpos_found"] == 1
+    assert body["errors"] == []
+
+
+@pytest.mark.parametrize("accept_encoding, suffix", [("identity", ""), ("gzip", "-gzip")])
+def test_export_csv_etag(client, analysis, accept_encoding, suffix):
+    """Exports carry a per-analysis ETag and a matching If-None-Match gets a 304."""
+    headers = {"Accept-Encoding": accept_encoding}
+    
+    response = client.get("/api/export/csv", headers=headers)
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert etag == f'"{analysis.fingerprint()}{suffix}"'
+    assert b"Test Setting" in response.content
+    
+    response = client.get("/api/export/csv", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip"])
+def test_export_csv_cached(client, analysis, monkeypatch, accept_encoding):
+    """A repeated download reuses the rendered (and compressed) CSV."""
+    renders = []
+    render = csv_exporter.CSVExporter.iter_combined
+    monkeypatch.setattr(
+        csv_exporter.CSVExporter, "iter_combined",
+        lambda self: renders.append(self) or render(self)
+    )
+    headers = {"Accept-Encoding": accept_encoding}
+    
+    first = client.get("/api/export/csv", headers=headers)
+    second = client.get("/api/export/csv", headers=headers)
+    
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert len(renders) == 1
+
+
+def test_export_zip(client, analysis):
+    """The streamed ZIP holds one CSV per section."""
+    response = client.get("/api/export/zip")
+    
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [
+            "gpos.csv", "settings.csv", "conflicts.csv",
+            "duplicates.csv", "improvements.csv", "summary.csv",
+        ]
+        gpos = archive.read("gpos.csv").decode("utf-8")
+        settings = archive.read("settings.csv").decode("utf-8")
+    assert "Test GPO" in gpos
+    assert "Test Setting" in settings
+    
+    sink = io.BytesIO()
+    export_to_zip(analysis, sink)
+    with zipfile.ZipFile(sink) as archive:
+        assert archive.read("settings.csv").decode("utf-8") == settings
+
+
+def test_fingerprint_covers_content(analysis):
+    """Results with the same timestamp and counts but other content differ."""
+    fingerprint = analysis.fingerprint()
+    renamed = analysis.model_copy(update={
+        "gpos": [GPOInfo(id="123", name="Renamed GPO", source_file="test.xml")]
+    })
+    
+    assert renamed.gpo_count == analysis.gpo_count
+    assert renamed.fingerprint() != fingerprint
+    assert analysis.model_copy().fingerprint() == fingerprint
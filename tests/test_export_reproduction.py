@@ -2,18 +2,23 @@
 import sys
 import os
 import logging
+import pytest
 from datetime import datetime
+from functools import lru_cache
 
 # Add project root to path
 sys.path.append('/home/user/git/GPOanalysis')
 
 from backend.app.models.gpo import AnalysisResult, GPOInfo, PolicySetting, SeverityLevel
-from backend.app.exporters.csv_exporter import export_to_csv
-from backend.app.exporters.pdf_exporter import export_to_pdf
+from backend.app.exporters import csv_exporter
+from backend.app.exporters.csv_exporter import export_to_csv, export_to_csv_file
+from backend.app.exporters.pdf_exporter import export_to_pdf, export_to_pdf_file
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Built once and shared; analysis results are not modified by exporters
+@lru_cache(maxsize=1)
 def create_dummy_data():
     return AnalysisResult(
         gpo_count=1,
@@ -58,6 +63,33 @@ def test_pdf():
         logger.error(f"PDF Export Failed: {e}")
         # import traceback
         # traceback.print_exc()
+def weasyprint_available():
+    """WeasyPrint needs Pango at import time, which may not be installed."""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
+
+def test_csv_file(tmp_path):
+    data = create_dummy_data()
+    
+    # Streamed while nothing is cached, written from the cache afterwards
+    csv_exporter._COMBINED_CACHE.clear()
+    streamed = export_to_csv_file(data, tmp_path / "streamed.csv")
+    expected = export_to_csv(data)
+    cached = export_to_csv_file(data, tmp_path / "cached.csv")
+    
+    for path in (streamed, cached):
+        with open(path, encoding="utf-8", newline="") as f:
+            assert f.read() == expected
+
+@pytest.mark.skipif(not weasyprint_available(), reason="WeasyPrint cannot be loaded")
+def test_pdf_file(tmp_path):
+    data = create_dummy_data()
+    path = export_to_pdf_file(data, tmp_path / "report.pdf")
+    assert path.read_bytes() == export_to_pdf(data)
+
 
 if __name__ == "__main__":
     test_csv()
@@ -23,7 +23,10 @@ def test_html_parser():
     """Test parsing the sample GPO HTML file."""
     sample_file = Path('/home/user/git/GPOanalysis/tests/sample_gpo.htm')
     
-    if not sample_file.exists():
+    # One stat for the existence check; the parser then reads the file
+    try:
+        os.stat(sample_file)
+    except FileNotFoundError:
         logger.error(f"Sample file not found: {sample_file}")
         return False
     
@@ -48,15 +51,21 @@ def test_html_parser():
         logger.error("FAIL: No settings found")
         return False
     
-    # Count settings by scope
-    computer_settings = [s for s in settings if s.scope == "Computer"]
-    user_settings = [s for s in settings if s.scope == "User"]
+    # Count settings by scope, and enabled settings (password settings
+    # have values), in one pass
+    computer_settings = []
+    user_settings = []
+    enabled_settings = []
+    for s in settings:
+        if s.scope == "Computer":
+            computer_settings.append(s)
+        elif s.scope == "User":
+            user_settings.append(s)
+        if s.state is PolicyState.ENABLED:
+            enabled_settings.append(s)
     
     logger.info(f"Computer settings: {len(computer_settings)}")
     logger.info(f"User settings: {len(user_settings)}")
-    
-    # Verify we got enabled settings (password settings have values)
-    enabled_settings = [s for s in settings if s.state == PolicyState.ENABLED]
     logger.info(f"Enabled settings: {len(enabled_settings)}")
     
     # List some settings for verification
@@ -72,7 +81,7 @@ def test_html_parser():
         logger.warning(f"GPO name mismatch, expected 'SEC-Baseline-Computer', got '{gpo.name}'")
     
     # Check we found expected settings
-    setting_names = [s.name for s in settings]
+    setting_names = {s.name for s in settings}
     
     expected_settings = [
         "Minimum password length",
@@ -121,6 +130,20 @@ def test_state_extraction():
     return all_passed
 
 
+def test_non_utf8_html():
+    """A cp1252 report without a charset still parses, with replacement chars."""
+    sample = Path(__file__).parent / 'sample_gpo.htm'
+    content = sample.read_text(encoding='utf-8').replace(
+        'SEC-Baseline-Computer', 'SEC-Baseline-Sécurité'
+    ).encode('cp1252')
+    
+    gpos, settings = GPOParser().parse_content(content, 'cp1252.htm', 'text/html')
+    
+    assert len(gpos) == 1
+    assert gpos[0].name == 'SEC-Baseline-S\ufffdcurit\ufffd'
+    assert len(settings) == 19
+
+
 if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("Testing State Extraction")
@@ -51,5 +51,16 @@ def test_parser():
         for s in settings:
             print(f"- {s.name}: {s.state} (Value: {s.value})")
 
+
+def test_non_utf8_xml():
+    """cp1252 bytes in a report without BOM or declaration are replaced, not fatal."""
+    content = XML_CONTENT.replace('Test GPO', 'Test GPO \u00e9').encode('cp1252')
+    
+    gpos, settings = GPOParser().parse_content(content, "cp1252.xml", "application/xml")
+    
+    assert [g.name for g in gpos] == ['Test GPO \ufffd']
+    assert len(settings) == 2
+
+
 if __name__ == "__main__":
     test_parser()
@@ -0,0 +1,115 @@
+"""
+Tests for saved analysis storage.
+
+Each test works on its own temporary storage directory.
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from backend.app import storage
+from backend.app.models.gpo import AnalysisResult, GPOInfo, PolicySetting
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_DIR", tmp_path)
+    storage._invalidate_listing()
+    storage._load_validated.cache_clear()
+    yield tmp_path
+    storage._invalidate_listing()
+    storage._load_validated.cache_clear()
+
+
+def make_analysis(gpo_count: int = 1) -> AnalysisResult:
+    return AnalysisResult(
+        analyzed_at=datetime(2024, 1, 2, 3, 4, 5),
+        gpo_count=gpo_count,
+        setting_count=1,
+        gpos=[
+            GPOInfo(id=str(i), name=f"GPO {i}", source_file="test.xml")
+            for i in range(gpo_count)
+        ],
+        settings=[PolicySetting(
+            gpo_id="0", gpo_name="GPO 0", category="Security",
+            name="Test Setting", value="Enabled"
+        )],
+    )
+
+
+def test_sidecars_are_not_analyses():
+    """Sidecar names can neither be loaded nor deleted on their own."""
+    filename = storage.save_analysis(make_analysis(), "test")["filename"]
+    sidecar = storage._meta_path(storage.STORAGE_DIR / filename).name
+    
+    assert storage.load_analysis(sidecar) is None
+    assert not storage.delete_saved_analysis(sidecar)["success"]
+    assert (storage.STORAGE_DIR / sidecar).exists()
+    
+    assert storage.load_analysis(filename).gpo_count == 1
+    assert storage.delete_saved_analysis(filename)["success"]
+    assert not (storage.STORAGE_DIR / sidecar).exists()
+
+
+def test_listing_cache():
+    """Listings are cached until a save or delete, and callers get copies."""
+    first = storage.save_analysis(make_analysis(), "first")["filename"]
+    
+    listing = storage.list_saved_analyses()
+    assert [a["filename"] for a in listing] == [first]
+    listing[0]["name"] = "changed"
+    listing.clear()
+    assert storage.list_saved_analyses()[0]["name"] == "first"
+    
+    # Keep the directory mtime unchanged, as a coarse timestamp would
+    dir_stat = os.stat(storage.STORAGE_DIR)
+    pinned = (dir_stat.st_atime_ns, dir_stat.st_mtime_ns)
+    
+    second = storage.save_analysis(make_analysis(), "second")["filename"]
+    os.utime(storage.STORAGE_DIR, ns=pinned)
+    assert {a["filename"] for a in storage.list_saved_analyses()} == {first, second}
+    
+    storage.delete_saved_analysis(first)
+    os.utime(storage.STORAGE_DIR, ns=pinned)
+    assert [a["filename"] for a in storage.list_saved_analyses()] == [second]
+
+
+def test_listing_backfills_sidecars_once():
+    """A listing that creates missing sidecars is not cached, but the next one is."""
+    filename = storage.save_analysis(make_analysis(), "old")["filename"]
+    storage._meta_path(storage.STORAGE_DIR / filename).unlink()
+    storage._invalidate_listing()
+    
+    assert storage.list_saved_analyses()[0]["gpo_count"] == 1
+    assert storage._meta_path(storage.STORAGE_DIR / filename).exists()
+    assert storage._listing_cache is None
+    
+    storage.list_saved_analyses()
+    cached = storage._listing_cache
+    assert cached is not None
+    storage.list_saved_analyses()
+    assert storage._listing_cache is cached
+
+
+def test_load_cache():
+    """Loads of an unchanged file are independent copies; a rewrite is read again."""
+    filename = storage.save_analysis(make_analysis(1), "test")["filename"]
+    filepath = storage.STORAGE_DIR / filename
+    
+    first = storage.load_analysis(filename)
+    first.gpos[0].name = "changed"
+    first.gpos.clear()
+    second = storage.load_analysis(filename)
+    assert [g.name for g in second.gpos] == ["GPO 0"]
+    assert storage._load_validated.cache_info().hits == 1
+    
+    # Rewrite in place with a distinct mtime
+    mtime_ns = filepath.stat().st_mtime_ns
+    other = storage.save_analysis(make_analysis(3), "other")["filename"]
+    (storage.STORAGE_DIR / other).replace(filepath)
+    os.utime(filepath, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+    
+    assert storage.load_analysis(filename).gpo_count == 3
+    assert storage._load_validated.cache_info().misses == 2